@@ -748,7 +748,7 @@ def generate_sequences(fuzzing_requests, checkers, fuzzing_jobs=1, garbage_colle
                     # Update the total number of request combinations
                     # This prevents confusing logging later on that is based on a different number of feasible
                     # combinations
-                    req_copy._total_feasible_combinations = 0
+                    req_copy._total_feasible_combinations = None
                     req_list.append(req_copy)
 
                 # Make the combination IDs match what they would have been if this sequence was rendered fully by RESTler
@@ -856,6 +856,9 @@ def generate_sequences(fuzzing_requests, checkers, fuzzing_jobs=1, garbage_colle
                 f"\n(After {fuzzing_schedule[length]} Render)\n"
             )
 
+            # Persist the network logs buffered during this generation
+            logger.NetworkLog.flush_all(fsync=True)
+
             # saving latest state
             saver.save(GrammarRequestCollection(), seq_collection, fuzzing_requests, Monitor(), generation)
 
@@ -889,8 +892,7 @@ def generate_sequences(fuzzing_requests, checkers, fuzzing_jobs=1, garbage_colle
             if request not in all_extended_requests:
                 request.stats.valid = 0
                 logger.print_request_coverage(request=request, log_rendered_hash=False)
-        # Generate the summary spec coverage file now that all of the combinations have been logged
-        logger.generate_summary_speccov()
+        # The summary spec coverage file is generated from the logged coverage at the end of the run
 
     if fuzzing_pool is not None:
         fuzzing_pool.close()
@@ -263,6 +263,24 @@ class FuzzingMonitor(object):
         """
         return self.status_codes_monitor.query_response_codes(request, valid_codes, fail_codes, lock)
 
+    def query_status_codes_monitor_batch(self, requests, valid_codes, fail_codes, lock=None):
+        """ Calls internal status codes monitor's query_response_codes_batch function
+
+        @param requests: The requests in question.
+        @type  requests: Iterable[Request]
+        @param valid_codes: List of status codes to query for.
+        @type  valid_codes: List[str]
+        @param fail_codes: List of failure status codes to query for.
+        @type  fail_codes: List[str]
+        @param lock: Lock object used for sync of more than one fuzzing jobs.
+        @type  lock: thread.Lock object
+
+        @return: The query result of each request, in the order of @param requests
+        @rtype : List[Namedtuple(valid_code, fully_valid, sequence_failure)]
+
+        """
+        return self.status_codes_monitor.query_response_codes_batch(requests, valid_codes, fail_codes, lock)
+
     def update_status_codes_monitor(self, sequence, status_codes, lock=None):
         """ Calls internal status codes monitor's update function
 
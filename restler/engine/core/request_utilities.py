@@ -239,13 +239,31 @@ def replace_auth_token(data, replace_str):
 
     """
     if data:
-        if latest_token_value:
-            data = data.replace(latest_token_value.strip('\r\n'), replace_str)
-        if latest_shadow_token_value:
-            data = data.replace(latest_shadow_token_value.strip('\r\n'), replace_str)
+        for token in _get_auth_tokens_to_replace():
+            data = data.replace(token, replace_str)
     return data
 
 
+def _get_auth_tokens_to_replace():
+    """ Gets the latest authentication tokens, without the trailing line breaks.
+    The result is cached until the tokens are refreshed.
+
+    @return: The authentication tokens to replace in a data string
+    @rtype : Tuple(Str)
+
+    """
+    cached_values, tokens = _get_auth_tokens_to_replace.cache
+    if cached_values != (latest_token_value, latest_shadow_token_value):
+        cached_values = (latest_token_value, latest_shadow_token_value)
+        tokens = tuple(value.strip('\r\n') for value in cached_values if value)
+        # Replacing an empty string would insert the replacement everywhere
+        tokens = tuple(token for token in tokens if token)
+        _get_auth_tokens_to_replace.cache = (cached_values, tokens)
+    return tokens
+
+_get_auth_tokens_to_replace.cache = (None, ())
+
+
 def resolve_dynamic_primitives(values, candidate_values_pool):
     """ Dynamic primitives (i.e., uuid4) must be filled with a new value
         each time the request is rendered.
@@ -270,6 +288,10 @@ def resolve_dynamic_primitives(values, candidate_values_pool):
     # There should only be one uuid4_suffix in the request for a given name
     current_uuid_suffixes = {}
     for i in range(len(values)):
+        # Most blocks, e.g. the static strings of the request line and headers, are already
+        # rendered.  Skip them without checking for each kind of dynamic primitive.
+        if isinstance(values[i], str):
+            continue
         # Look for function pointers assigned to dynamic primitives
         if isinstance(values[i], tuple)\
         and values[i][0] == primitives.restler_fuzzable_uuid4:
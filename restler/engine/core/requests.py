@@ -286,7 +286,7 @@ class Request(object):
 
         """
         self._current_combination_id = 0
-        self._total_feasible_combinations = 0
+        self._total_feasible_combinations = None
         self._hex_definition = 0
         self._method_endpoint_hex_definition = 0
         self._request_id = 0
@@ -1171,6 +1171,19 @@ class Request(object):
             max_combinations = 1 if is_example else Settings().max_combinations
             combinations_pool = itertools.islice(combinations_pool, max_combinations)
 
+            # The blocks of the path and query that must be encoded depend only on the schema,
+            # so find them once instead of for every combination.
+            # Custom payloads are expected to be used exactly as-is, and static strings are not
+            # parameter values, so neither of these is encoded.
+            url_encode_start, url_encode_end = req.get_path_and_query_start_end()
+            url_encode_indices = [url_idx for url_idx in range(url_encode_start, url_encode_end)
+                                  if req.definition[url_idx][0] not in [primitives.STATIC_STRING,
+                                                                        primitives.REFRESHABLE_AUTHENTICATION_TOKEN,
+                                                                        primitives.CUSTOM_PAYLOAD,
+                                                                        primitives.CUSTOM_PAYLOAD_HEADER,
+                                                                        primitives.CUSTOM_PAYLOAD_QUERY,
+                                                                        primitives.CUSTOM_PAYLOAD_UUID4_SUFFIX]]
+
             # skip combinations, if asked to
             while next_combination < skip:
                 try:
@@ -1241,18 +1254,9 @@ class Request(object):
                 if cached_values:
                     self._rendered_values_cache.add_fuzzable_values(next_combination, cached_values)
 
-                # Encode the path and query parameters, except custom payloads which are expected
-                # to be used exactly as-is
-                url_encode_start, url_encode_end = req.get_path_and_query_start_end()
-                for url_idx in range(url_encode_start, url_encode_end):
-                    # Only encode the parameter values, not static strings
-                    if req.definition[url_idx][0] not in [primitives.STATIC_STRING,
-                                                          primitives.REFRESHABLE_AUTHENTICATION_TOKEN,
-                                                          primitives.CUSTOM_PAYLOAD,
-                                                          primitives.CUSTOM_PAYLOAD_HEADER,
-                                                          primitives.CUSTOM_PAYLOAD_QUERY,
-                                                          primitives.CUSTOM_PAYLOAD_UUID4_SUFFIX]:
-                        values[url_idx] = url_quote_plus(values[url_idx], safe="/")
+                # Encode the path and query parameters
+                for url_idx in url_encode_indices:
+                    values[url_idx] = url_quote_plus(values[url_idx], safe="/")
 
                 if value_list:
                     rendered_data = values
@@ -1317,8 +1321,9 @@ class Request(object):
         @rtype : Int
 
         """
-        # Memoize the last value returned by this function (if invoked)
-        if self._total_feasible_combinations:
+        # Memoize the last value returned by this function (if invoked),
+        # including requests with no feasible combinations
+        if self._total_feasible_combinations is not None:
             return self._total_feasible_combinations
 
         # Otherwise, do calculation
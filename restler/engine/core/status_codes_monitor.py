@@ -5,6 +5,8 @@
 import time
 import collections
 
+QueryResult = collections.namedtuple('QueryResult', ['valid_code', 'fully_valid', 'sequence_failure'])
+
 class RequestExecutionStatus(object):
     """ RequestExecutionStatus class. """
     def __init__(self, timestamp, request_hex, status_code, is_fully_valid, sequence_failure, num_test_cases=0):
@@ -137,7 +139,6 @@ class StatusCodesMonitor(object):
         if lock is not None:
             lock.acquire()
 
-        QueryResult = collections.namedtuple('QueryResult', ['valid_code', 'fully_valid', 'sequence_failure'])
         for seq_hash in self._sequence_statuses:
             # iterate over each status code that was detected in this sequence
             for code in self._sequence_statuses[seq_hash].request_statuses:
@@ -157,6 +158,48 @@ class StatusCodesMonitor(object):
             lock.release()
         return QueryResult(valid_code=False, fully_valid=False, sequence_failure=False)
 
+    def query_response_codes_batch(self, requests, status_codes, fail_codes, lock):
+        """ Same as query_response_codes, for each request of @param requests.
+        The internal monitor is scanned once, under a single acquisition of @param lock.
+
+        @param requests: The requests in question.
+        @type  requests: Iterable[Request]
+        @param status_codes: List of status codes to query for.
+        @type  status_codes: List
+        @param fail_codes: List of failing status codes to query for.
+        @type  fail_codes: List
+        @param lock: Lock object used for sync of more than one fuzzing jobs.
+        @type  lock: thread.Lock object
+
+        @return: The query result of each request, in the order of @param requests
+        @rtype : List[Namedtuple(valid_code, fully_valid, sequence_failure)]
+
+        """
+        if lock is not None:
+            lock.acquire()
+        try:
+            # The first matching status of each request, in the same order
+            # as they are visited by query_response_codes
+            first_results = {}
+            for seq_hash in self._sequence_statuses:
+                request_statuses = self._sequence_statuses[seq_hash].request_statuses
+                for code in request_statuses:
+                    if code in status_codes:
+                        valid_code = True
+                    elif code in fail_codes:
+                        valid_code = False
+                    else:
+                        continue
+                    for req in request_statuses[code]:
+                        if req.request_hex not in first_results:
+                            first_results[req.request_hex] = QueryResult(valid_code, req.is_fully_valid, req.sequence_failure)
+        finally:
+            if lock is not None:
+                lock.release()
+
+        no_result = QueryResult(valid_code=False, fully_valid=False, sequence_failure=False)
+        return [first_results.get(request.hex_definition, no_result) for request in requests]
+
     def update(self, sequence, status_codes, lock):
         """ Updates the internal monitor with status codes received.
 
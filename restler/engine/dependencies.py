@@ -15,6 +15,11 @@ import utils.formatting as formatting
 from utils.logging.trace_db import SequenceTracker
 from restler_settings import Settings
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class ResourceTypeQuotaExceededException(Exception):
     pass
 
@@ -153,6 +158,55 @@ def set_variable(type, value):
     else:
         __add_variable_to_dyn_cache(type, value, dyn_objects_cache, dyn_objects_cache_lock)
 
+# orjson parses the integers outside of this range as floats
+_ORJSON_INTEGER_RANGE = (-2**63, 2**64 - 1)
+
+def _has_out_of_range_integer(obj):
+    """ Returns whether a value deserialized by orjson contains a float that may
+    have been parsed from an integer outside of the 64-bit range.
+
+    @param obj: The deserialized value
+    @type  obj: Any
+
+    @return: True if the value contains such a float
+    @rtype : Bool
+
+    """
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, float) and value.is_integer() and\
+             not _ORJSON_INTEGER_RANGE[0] <= value <= _ORJSON_INTEGER_RANGE[1]:
+            return True
+    return False
+
+def json_loads(data):
+    """ Deserializes the json body of a response in a response parser.
+    Uses orjson when it is installed, and falls back to the json module for
+    bodies orjson rejects (e.g. NaN or Infinity) and for bodies with integers
+    outside of the 64-bit range, which orjson parses as floats.
+
+    @param data: The json body of the response
+    @type  data: Str
+
+    @return: The deserialized body
+    @rtype : Any
+
+    """
+    if orjson is not None:
+        try:
+            obj = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+        else:
+            if not _has_out_of_range_integer(obj):
+                return obj
+    return json.loads(data)
+
 def print_variables():
     """ Prints all dynamic variables and their values.
 
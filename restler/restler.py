@@ -603,6 +603,11 @@ if __name__ == '__main__':
             monitor.terminate_fuzzing()
         num_total_sequences = fuzz_thread.join(THREAD_JOIN_WAIT_TIME_SECONDS)
 
+    # Generate the json spec coverage files (including speccov.json in smoke test mode)
+    # from the coverage logged while fuzzing, before the cleanup, which may be interrupted.
+    # If the run is stopped before this point, they are generated at exit.
+    logger.write_speccov_files()
+
     try:
         # Attempt to delete the create_once resources.
         # Note: This is done in addition to attempting to use the garbage collector.
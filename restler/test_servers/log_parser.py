@@ -4,8 +4,10 @@
 """ Module includes classes used to parse logs for testing purposes """
 from test_servers.parsed_requests import *
 
+import os
 import copy
 import json
+import mmap
 from collections import Counter
 
 SENDING = ': Sending: '
@@ -23,6 +25,60 @@ class TestFailedException(Exception):
     """ Raised when a failure occurred while running the test. """
     pass
 
+class MappedLogFile:
+    """ Reads the lines of a log file through a read-only memory map.
+    Each line is found by scanning the mapped bytes for the next newline, so the file
+    is not copied into a read buffer before the lines are decoded.
+    """
+    def __init__(self, path):
+        """ MappedLogFile constructor
+
+        @param path: The path to the log file
+        @type  path: Str
+
+        """
+        with open(path, 'rb') as file:
+            # Empty files cannot be mapped
+            if os.fstat(file.fileno()).st_size > 0:
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._map = b''
+        self._pos = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """ Unmaps the log file
+
+        @return: None
+        @rtype : None
+
+        """
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+
+    def readline(self):
+        """ Reads the next line of the log file, in the same way as readline on
+        a file opened in text mode.  Windows line endings are translated to '\\n'.
+
+        @return: The next line, including its newline, or an empty string at the end of the file
+        @rtype : Str
+
+        """
+        if self._pos >= len(self._map):
+            return ''
+        end = self._map.find(b'\n', self._pos)
+        end = len(self._map) if end == -1 else end + 1
+        line = self._map[self._pos:end]
+        self._pos = end
+        if line.endswith(b'\r\n'):
+            line = line[:-2] + b'\n'
+        return line.decode('utf-8')
+
 class LogParser:
     """ Base class for log parsers """
     def __init__(self, path):
@@ -73,7 +129,7 @@ class FuzzingLogParser(LogParser):
         """ Moves the log file's pointer beyond a replay section
 
         @param file: The log file's pointer
-        @type  file: IO
+        @type  file: MappedLogFile
 
         @return: None
         @rtype : None
@@ -91,7 +147,7 @@ class FuzzingLogParser(LogParser):
         @param line: The CHECKER_START line
         @type  line: Str
         @param file: The log file's pointer
-        @type  file: IO
+        @type  file: MappedLogFile
 
         @return: None
         @type  : None
@@ -260,7 +316,7 @@ class FuzzingLogParser(LogParser):
                 return True
             return False
 
-        with open(self._path, 'r') as file:
+        with MappedLogFile(self._path) as file:
             try:
                 line = file.readline()
 
@@ -0,0 +1,72 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+""" Tests for writing the bug hashes to bug_buckets.json and bug_buckets.ndjson. """
+
+import unittest
+import os
+import json
+import tempfile
+
+import utils.logger as logger
+
+class BugHashesTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.original_bug_buckets_dir = logger.BUG_BUCKETS_DIR
+        logger.BUG_BUCKETS_DIR = self.temp_dir.name
+        self.log_path = os.path.join(self.temp_dir.name, "bug_buckets.ndjson")
+        self.json_path = os.path.join(self.temp_dir.name, "bug_buckets.json")
+
+    def tearDown(self):
+        if logger.Bug_Hashes_Log is not None:
+            logger.Bug_Hashes_Log.close()
+        logger.Bug_Hashes_Log = None
+        logger.Bug_Hashes = dict()
+        logger.Bug_Hashes_Unsaved = 0
+        logger.BUG_BUCKETS_DIR = self.original_bug_buckets_dir
+        self.temp_dir.cleanup()
+
+    def read_log(self):
+        with open(self.log_path, 'r', encoding='utf-8') as file:
+            return [json.loads(line) for line in file]
+
+    def read_json(self):
+        with open(self.json_path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+
+    def test_nothing_is_written_without_bugs(self):
+        logger.write_bug_hashes(close_log=True)
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+    def test_write_bug_hashes(self):
+        logger.add_bug_hash("hash_1", "main_driver_500_1.txt")
+        logger.add_bug_hash("hash_2", "UseAfterFreeChecker_20x_1.txt")
+        # The log is buffered until the bug hashes are written
+        self.assertEqual(self.read_log(), [])
+
+        logger.write_bug_hashes()
+        expected = {"hash_1": {"file_path": "main_driver_500_1.txt"},
+                    "hash_2": {"file_path": "UseAfterFreeChecker_20x_1.txt"}}
+        self.assertEqual(self.read_json(), expected)
+        self.assertEqual(self.read_log(), [{k: v} for k, v in expected.items()])
+        self.assertEqual(logger.Bug_Hashes_Unsaved, 0)
+        self.assertFalse(logger.Bug_Hashes_Log.closed)
+
+        logger.add_bug_hash("hash_3", "main_driver_500_2.txt")
+        log_file = logger.Bug_Hashes_Log
+        # At exit, the log is also closed
+        logger.write_bug_hashes(close_log=True)
+        self.assertTrue(log_file.closed)
+        self.assertIsNone(logger.Bug_Hashes_Log)
+        self.assertEqual(list(self.read_json().keys()), ["hash_1", "hash_2", "hash_3"])
+        self.assertEqual(len(self.read_log()), 3)
+
+    def test_bug_hashes_are_written_periodically(self):
+        for i in range(logger.BUG_HASHES_SAVE_INTERVAL - 1):
+            logger.add_bug_hash(f"hash_{i}", f"main_driver_500_{i}.txt")
+        self.assertFalse(os.path.exists(self.json_path))
+
+        logger.add_bug_hash("hash_last", "main_driver_500_last.txt")
+        self.assertEqual(len(self.read_json()), logger.BUG_HASHES_SAVE_INTERVAL)
+        self.assertEqual(len(self.read_log()), logger.BUG_HASHES_SAVE_INTERVAL)
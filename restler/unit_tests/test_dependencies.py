@@ -0,0 +1,39 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+""" Tests for the dependency helpers used by the generated response parsers. """
+
+import unittest
+import json
+import math
+
+import engine.dependencies as dependencies
+
+class JsonLoadsTest(unittest.TestCase):
+    def test_json_loads(self):
+        body = '{"id": "12345678901234567890", "count": 9223372036854775807, "tags": ["a", null]}'
+        self.assertEqual(dependencies.json_loads(body), json.loads(body))
+
+    def test_json_loads_integers_outside_64_bit_range(self):
+        for body in ['{"id": 123456789012345678901234567890}',
+                     '[{"id": -9223372036854775809, "ids": [18446744073709551616]}]']:
+            with self.subTest(body=body):
+                data = dependencies.json_loads(body)
+                self.assertEqual(data, json.loads(body))
+                self.assertEqual(json.dumps(data), json.dumps(json.loads(body)))
+
+        data = dependencies.json_loads('{"id": 123456789012345678901234567890}')
+        self.assertIsInstance(data['id'], int)
+        self.assertEqual(data['id'], 123456789012345678901234567890)
+        # Integers at the ends of the 64-bit range and large floats are parsed the same way
+        body = '{"min": -9223372036854775808, "max": 18446744073709551615, "float": 1.5e300}'
+        self.assertEqual(dependencies.json_loads(body), json.loads(body))
+
+    def test_json_loads_falls_back_for_non_standard_json(self):
+        # NaN is rejected by orjson and accepted by the json module
+        data = dependencies.json_loads('{"value": NaN}')
+        self.assertTrue(math.isnan(data['value']))
+
+    def test_json_loads_invalid_body(self):
+        with self.assertRaises(json.JSONDecodeError):
+            dependencies.json_loads('{"id": ')
@@ -3,6 +3,7 @@
 
 import unittest
 import os
+import tempfile
 
 from unittest.mock import mock_open
 
@@ -11,6 +12,34 @@ from test_servers.log_parser import *
 
 LOG_DIR = 'test_logs'
 
+class MappedLogFileTest(unittest.TestCase):
+    def read_lines(self, data):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'log.txt')
+            with open(path, 'wb') as file:
+                file.write(data)
+            lines = []
+            with MappedLogFile(path) as file:
+                line = file.readline()
+                while line:
+                    lines.append(line)
+                    line = file.readline()
+                # Reading past the end of the file keeps returning an empty string
+                self.assertEqual(file.readline(), '')
+            with open(path, 'r', encoding='utf-8') as file:
+                self.assertEqual(lines, file.readlines())
+            return lines
+
+    def test_readline(self):
+        self.assertEqual(self.read_lines(b"first\nsecond 'caf\xc3\xa9'\n\nlast"),
+                         ["first\n", "second 'café'\n", "\n", "last"])
+
+    def test_readline_windows_line_endings(self):
+        self.assertEqual(self.read_lines(b"first\r\nsecond\r\n"), ["first\n", "second\n"])
+
+    def test_readline_empty_file(self):
+        self.assertEqual(self.read_lines(b""), [])
+
 class LogParserTest(unittest.TestCase):
     def test_get_request_sending(self):
         parser = LogParser("")
@@ -98,6 +127,19 @@ class FuzzingLogParserTest(unittest.TestCase):
         with self.assertRaises(TestFailedException):
             parser = FuzzingLogParser(os.path.join(os.path.dirname(__file__), LOG_DIR, "fuzzing_log_bad.txt"))
 
+    def test_parse_windows_line_endings(self):
+        log_path = os.path.join(os.path.dirname(__file__), LOG_DIR, "fuzzing_log.txt")
+        with open(log_path, 'rb') as file:
+            log_data = file.read()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            crlf_log_path = os.path.join(temp_dir, "fuzzing_log.txt")
+            with open(crlf_log_path, 'wb') as file:
+                file.write(log_data.replace(b"\n", b"\r\n"))
+            crlf_parser = FuzzingLogParser(crlf_log_path)
+        parser = FuzzingLogParser(log_path)
+        self.assertTrue(parser._seq_list)
+        self.assertEqual(parser._seq_list, crlf_parser._seq_list)
+
 class GarbageCollectorLogParserTest(unittest.TestCase):
     def test_parse(self):
         parser = GarbageCollectorLogParser(os.path.join(os.path.dirname(__file__), LOG_DIR, 'gc_log.txt'))
@@ -0,0 +1,116 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+""" Tests for the formatting of request payloads in the logs. """
+
+import unittest
+
+import utils.logger as logger
+from engine import primitives
+
+class RecordingCandidateValuesPool(object):
+    """ Candidate values pool that returns configured values and records the queries. """
+    def __init__(self, candidate_values=None, fuzzable_values=None):
+        self.candidate_values = candidate_values
+        self.fuzzable_values = fuzzable_values
+        self.calls = []
+
+    def get_candidate_values(self, primitive, request_id=None, tag=None, quoted=False):
+        self.calls.append(('get_candidate_values', primitive, request_id, tag, quoted))
+        return self.candidate_values
+
+    def get_fuzzable_values(self, primitive, default_value, request_id=None, quoted=False, examples=None):
+        self.calls.append(('get_fuzzable_values', primitive, default_value, request_id, quoted, examples))
+        return self.fuzzable_values
+
+class EscapePayloadTest(unittest.TestCase):
+    def test_matches_repr(self):
+        payloads = [
+            "",
+            "GET /city/cityName HTTP/1.1",
+            "restler fuzzable string",
+            "\r\n",
+            "Content-Type: application/json\r\n\r\n",
+            '{"name": "city"}',
+            "it's",
+            "it's \"quoted\"",
+            "back\\slash",
+            "tab\tseparated",
+            "\x00\x1f\x7f",
+            "café ☃",
+            "\u200b zero width space",
+            "\ud800",
+            5,
+            None,
+            b"bytes payload",
+        ]
+        for payload in payloads:
+            with self.subTest(payload=payload):
+                self.assertEqual(logger.escape_payload(payload), repr(payload)[1:-1])
+
+    def test_plain_string_is_returned_unchanged(self):
+        payload = "/city/cityName"
+        self.assertIs(logger.escape_payload(payload), payload)
+
+class FormatRequestBlockTest(unittest.TestCase):
+    def format_request_block(self, request_block, candidate_values_pool):
+        primitive, values, default_val = logger.format_request_block("req", request_block, candidate_values_pool)
+        # The values may be a list or a tuple
+        return primitive, list(values), default_val
+
+    def test_fuzzable_uuid4(self):
+        pool = RecordingCandidateValuesPool()
+        result = self.format_request_block(primitives.restler_fuzzable_uuid4("id"), pool)
+        self.assertEqual(result, (primitives.FUZZABLE_UUID4, [primitives.restler_fuzzable_uuid4], "id"))
+        self.assertEqual(pool.calls, [])
+
+    def test_fuzzable_group(self):
+        pool = RecordingCandidateValuesPool()
+        result = self.format_request_block(primitives.restler_fuzzable_group("color", ("red", "blue")), pool)
+        self.assertEqual(result, (primitives.FUZZABLE_GROUP, ["red", "blue"], ["red", "blue"]))
+        self.assertEqual(pool.calls, [])
+
+    def test_multipart_formdata(self):
+        pool = RecordingCandidateValuesPool()
+        result = self.format_request_block(primitives.restler_multipart_formdata("file"), pool)
+        self.assertEqual(result, (primitives.FUZZABLE_MULTIPART_FORMDATA,
+                                  ['_OMITTED_BINARY_DATA_'], '_OMITTED_BINARY_DATA_'))
+        self.assertEqual(pool.calls, [])
+
+    def test_custom_payload(self):
+        for primitive_func in [primitives.restler_custom_payload,
+                               primitives.restler_custom_payload_header,
+                               primitives.restler_custom_payload_query]:
+            with self.subTest(primitive=primitive_func.__name__):
+                # A single value is used as the default value
+                pool = RecordingCandidateValuesPool(candidate_values="value1")
+                result = self.format_request_block(primitive_func("tag", quoted=True), pool)
+                self.assertEqual(result, (primitive_func.__name__, ["value1"], "value1"))
+                self.assertEqual(pool.calls, [('get_candidate_values', primitive_func.__name__, "req", "tag", True)])
+
+                # There is no default value when there are several values
+                pool = RecordingCandidateValuesPool(candidate_values=["value1", "value2"])
+                result = self.format_request_block(primitive_func("tag"), pool)
+                self.assertEqual(result, (primitive_func.__name__, ["value1", "value2"], None))
+
+    def test_custom_payload_uuid4_suffix(self):
+        pool = RecordingCandidateValuesPool(candidate_values=["name", "other"])
+        result = self.format_request_block(primitives.restler_custom_payload_uuid4_suffix("tag"), pool)
+        self.assertEqual(result, (primitives.CUSTOM_PAYLOAD_UUID4_SUFFIX, ["name", "other"], "name"))
+        self.assertEqual(pool.calls, [('get_candidate_values', primitives.CUSTOM_PAYLOAD_UUID4_SUFFIX,
+                                       "req", "tag", False)])
+
+    def test_fuzzable_values(self):
+        pool = RecordingCandidateValuesPool(fuzzable_values=["fuzzstring", "ex"])
+        request_block = primitives.restler_fuzzable_string("default", quoted=True, examples=["ex"])
+        result = self.format_request_block(request_block, pool)
+        self.assertEqual(result, (primitives.FUZZABLE_STRING, ["fuzzstring", "ex"], "default"))
+        self.assertEqual(pool.calls, [('get_fuzzable_values', primitives.FUZZABLE_STRING,
+                                       "default", "req", True, ["ex"])])
+
+    def test_fuzzable_value_generator(self):
+        def value_generator_wrapper():
+            yield "generated"
+        pool = RecordingCandidateValuesPool(fuzzable_values=value_generator_wrapper)
+        result = self.format_request_block(primitives.restler_fuzzable_int("1"), pool)
+        self.assertEqual(result, (primitives.FUZZABLE_INT, [value_generator_wrapper], "1"))
@@ -0,0 +1,65 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+""" Tests for buffered writes to the main log. """
+
+import unittest
+import os
+import tempfile
+import threading
+import time
+
+import utils.logger as logger
+from restler_settings import RestlerSettings
+
+class MainLogTest(unittest.TestCase):
+    def setUp(self):
+        RestlerSettings({})
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.original_main_logs = logger.MAIN_LOGS
+        logger.MAIN_LOGS = os.path.join(self.temp_dir.name, 'main.txt')
+
+    def tearDown(self):
+        logger.MainLogBuffer.flush_all()
+        logger.close_log_handles()
+        logger.MAIN_LOGS = self.original_main_logs
+        RestlerSettings.TEST_DeleteInstance()
+        self.temp_dir.cleanup()
+
+    def read_main_log(self):
+        with open(logger.MAIN_LOGS, 'r', encoding='utf-8') as file:
+            return file.read().splitlines()
+
+    def test_lines_from_all_threads_are_in_logging_order(self):
+        num_threads = 4
+        lines_per_thread = 200
+        # Each line is numbered in the order it is logged across all of the threads
+        sequence_lock = threading.Lock()
+        next_line = [0]
+
+        start_barrier = threading.Barrier(num_threads)
+
+        def log_lines(thread_idx):
+            start_barrier.wait()
+            for _ in range(lines_per_thread):
+                with sequence_lock:
+                    logger.write_to_main(f"{next_line[0]} thread {thread_idx}")
+                    next_line[0] += 1
+                # Let the other threads log in between
+                time.sleep(0.0001)
+
+        threads = [threading.Thread(target=log_lines, args=(i,)) for i in range(num_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        logger.MainLogBuffer.flush_all()
+
+        line_numbers = [int(line.split(" ")[0]) for line in self.read_main_log()]
+        self.assertEqual(line_numbers, list(range(num_threads * lines_per_thread)))
+
+    def test_console_output_is_not_ahead_of_main_log(self):
+        logger.write_to_main("buffered line")
+        logger.write_to_main("console line", print_to_console=True)
+        # The lines printed to the console are in the main log without waiting for the background flush
+        self.assertEqual(self.read_main_log(), ["buffered line", "console line"])
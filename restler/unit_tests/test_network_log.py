@@ -0,0 +1,117 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+""" Tests for the buffered network logs. """
+
+import unittest
+import os
+import sys
+import tempfile
+import subprocess
+import time
+
+import utils.logger as logger
+from restler_settings import RestlerSettings
+
+Restler_Dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+class NetworkLogTest(unittest.TestCase):
+    def setUp(self):
+        RestlerSettings({})
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.original_network_logs = logger.NETWORK_LOGS
+        logger.NETWORK_LOGS = os.path.join(self.temp_dir.name, 'network.txt')
+        self.network_logs = []
+
+    def tearDown(self):
+        for network_log in self.network_logs:
+            network_log.close()
+        logger.NETWORK_LOGS = self.original_network_logs
+        RestlerSettings.TEST_DeleteInstance()
+        self.temp_dir.cleanup()
+
+    def create_network_log(self, log_name, thread_id):
+        network_log = logger.NetworkLog(log_name, thread_id)
+        self.network_logs.append(network_log)
+        return network_log
+
+    def read_log(self, log_name, thread_id, log_num=1):
+        with open(logger.build_logfile_path(logger.NETWORK_LOGS, log_name, thread_id, log_num),
+                  'r', encoding='utf-8') as file:
+            return file.read()
+
+    def test_writes_are_buffered_until_flush(self):
+        network_log = self.create_network_log(logger.LOG_TYPE_TESTING, 0)
+        # The log file is created with the network log
+        self.assertEqual(self.read_log(logger.LOG_TYPE_TESTING, 0), "")
+
+        network_log.write("Sending: 'GET /city HTTP/1.1'")
+        network_log.write("Received: 'HTTP/1.1 200 OK'")
+        logger.NetworkLog.flush_all(fsync=True)
+        self.assertEqual(self.read_log(logger.LOG_TYPE_TESTING, 0),
+                         "Sending: 'GET /city HTTP/1.1'\nReceived: 'HTTP/1.1 200 OK'\n")
+
+    def test_writes_are_flushed_in_the_background(self):
+        network_log = self.create_network_log(logger.LOG_TYPE_TESTING, 1)
+        network_log.write("background line")
+        self.assertTrue(logger.NetworkLog._FlushThread.is_alive())
+
+        deadline = time.time() + 10 * logger.NetworkLog._FlushInterval
+        while self.read_log(logger.LOG_TYPE_TESTING, 1) == "" and time.time() < deadline:
+            time.sleep(logger.NetworkLog._FlushInterval / 4)
+        self.assertEqual(self.read_log(logger.LOG_TYPE_TESTING, 1), "background line\n")
+
+    def test_log_is_rolled_over_at_the_max_size(self):
+        original_max_log_size = logger.NetworkLog._MaxLogSize
+        logger.NetworkLog._MaxLogSize = 10
+        try:
+            network_log = self.create_network_log(logger.LOG_TYPE_TESTING, 2)
+            network_log.write("first line")
+            network_log.write("second line")
+            network_log.write("third line")
+            network_log.flush()
+        finally:
+            logger.NetworkLog._MaxLogSize = original_max_log_size
+
+        self.assertEqual(self.read_log(logger.LOG_TYPE_TESTING, 2, log_num=1), "first line\n")
+        self.assertEqual(self.read_log(logger.LOG_TYPE_TESTING, 2, log_num=2), "second line\n")
+        self.assertEqual(self.read_log(logger.LOG_TYPE_TESTING, 2, log_num=3), "third line\n")
+
+    def test_close(self):
+        network_log = self.create_network_log(logger.LOG_TYPE_TESTING, 4)
+        network_log.write("line before close")
+        network_log.close()
+        self.assertEqual(self.read_log(logger.LOG_TYPE_TESTING, 4), "line before close\n")
+        # Closing again and flushing a closed log do nothing
+        network_log.close()
+        network_log.flush()
+        logger.NetworkLog.flush_all()
+
+    def test_writes_are_skipped_when_logging_is_disabled(self):
+        RestlerSettings.TEST_DeleteInstance()
+        RestlerSettings({'disable_logging': True})
+        network_log = self.create_network_log(logger.LOG_TYPE_TESTING, 3)
+        network_log.write("not logged")
+        network_log.flush()
+        self.assertEqual(self.read_log(logger.LOG_TYPE_TESTING, 3), "")
+
+    def test_writes_are_flushed_at_exit(self):
+        # The background flush runs much less often than the process runs, and the process
+        # exits without finalizing its open files, so the line is only written by the flush
+        # that is registered to run at exit
+        script = (
+            "import os\n"
+            "import sys\n"
+            "import atexit\n"
+            "import utils.logger as logger\n"
+            "from restler_settings import RestlerSettings\n"
+            "RestlerSettings({})\n"
+            "logger.NETWORK_LOGS = sys.argv[1]\n"
+            "logger.NetworkLog._FlushInterval = 3600\n"
+            "network_log = logger.NetworkLog(logger.LOG_TYPE_TESTING, 0)\n"
+            "network_log.write('line written before exit')\n"
+            "atexit._run_exitfuncs()\n"
+            "os._exit(0)\n"
+        )
+        subprocess.run([sys.executable, "-c", script, logger.NETWORK_LOGS], cwd=Restler_Dir, check=True)
+        self.assertEqual(self.read_log(logger.LOG_TYPE_TESTING, 0), "line written before exit\n")
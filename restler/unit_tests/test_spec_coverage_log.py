@@ -0,0 +1,151 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+""" Tests for generating the json spec coverage files from the incremental (ndjson) coverage. """
+
+import unittest
+import os
+import json
+import tempfile
+
+import utils.logger as logger
+from restler_settings import RestlerSettings
+
+def coverage_entry(verb_endpoint, valid):
+    verb, endpoint = verb_endpoint.split(" ")
+    return {
+        'verb': verb,
+        'endpoint': endpoint,
+        'verb_endpoint': verb_endpoint,
+        'valid': valid,
+        'matching_prefix': [],
+        'invalid_due_to_sequence_failure': 0,
+        'invalid_due_to_resource_failure': 0,
+        'invalid_due_to_parser_failure': 0,
+        'invalid_due_to_500': 1 - valid
+    }
+
+class SpecCoverageLogTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.original_logs_dir = logger.LOGS_DIR
+        logger.LOGS_DIR = self.temp_dir.name
+
+    def tearDown(self):
+        logger.SpecCoverageLog._SpecCoverageLog__instance = None
+        logger.LOGS_DIR = self.original_logs_dir
+        RestlerSettings.TEST_DeleteInstance()
+        self.temp_dir.cleanup()
+
+    def append_coverage(self, file_name, coverage):
+        with open(logger.get_incremental_speccov_path(file_name), 'ab') as file:
+            for req_hash, entry in coverage:
+                file.write(logger.json_dumps_bytes({req_hash: entry}, indent=False) + b"\n")
+
+    def load_json(self, file_name):
+        with open(os.path.join(logger.LOGS_DIR, file_name), 'r', encoding='utf-8') as file:
+            return json.load(file)
+
+    def test_json_files_are_generated_from_ndjson(self):
+        RestlerSettings({'fuzzing_mode': 'directed-smoke-test'})
+        logger.SpecCoverageLog()
+        # The incremental files are created when the spec coverage log is initialized
+        for file_name in [logger.SPECCOV_ALL_COMBINATIONS_FILE, logger.SPECCOV_MIN_FILE]:
+            self.assertTrue(os.path.exists(logger.get_incremental_speccov_path(file_name)))
+
+        self.append_coverage(logger.SPECCOV_ALL_COMBINATIONS_FILE, [
+            ("get_1", coverage_entry("GET /city", 0)),
+            ("put_1", coverage_entry("PUT /city", 1)),
+            ("get_2", coverage_entry("GET /city", 1)),
+            # A later line for the same request hash replaces the earlier result
+            ("put_1", coverage_entry("PUT /city", 0)),
+        ])
+        self.append_coverage(logger.SPECCOV_MIN_FILE, [
+            ("get_1", coverage_entry("GET /city", 0)),
+        ])
+
+        logger.write_speccov_files()
+
+        all_combinations = self.load_json(logger.SPECCOV_ALL_COMBINATIONS_FILE)
+        self.assertEqual(list(all_combinations.keys()), ["get_1", "put_1", "get_2"])
+        self.assertEqual(all_combinations["put_1"]["valid"], 0)
+        self.assertEqual(all_combinations["get_2"], coverage_entry("GET /city", 1))
+
+        self.assertEqual(self.load_json(logger.SPECCOV_MIN_FILE), {"get_1": coverage_entry("GET /city", 0)})
+
+        # The summary has the first valid result for each request type
+        summary = self.load_json('speccov.json')
+        self.assertEqual(summary, {"put_1": coverage_entry("PUT /city", 0),
+                                   "get_2": coverage_entry("GET /city", 1)})
+
+        # The incremental files are kept as output
+        for file_name in [logger.SPECCOV_ALL_COMBINATIONS_FILE, logger.SPECCOV_MIN_FILE]:
+            self.assertTrue(os.path.exists(logger.get_incremental_speccov_path(file_name)))
+
+    def test_summary_is_only_generated_in_smoke_test_mode(self):
+        RestlerSettings({'fuzzing_mode': 'bfs'})
+        logger.SpecCoverageLog()
+        self.append_coverage(logger.SPECCOV_ALL_COMBINATIONS_FILE, [
+            ("get_1", coverage_entry("GET /city", 1)),
+        ])
+
+        logger.write_speccov_files()
+
+        self.assertEqual(self.load_json(logger.SPECCOV_ALL_COMBINATIONS_FILE), {"get_1": coverage_entry("GET /city", 1)})
+        self.assertEqual(self.load_json(logger.SPECCOV_MIN_FILE), {})
+        self.assertFalse(os.path.exists(os.path.join(logger.LOGS_DIR, 'speccov.json')))
+
+    def test_incomplete_last_line_is_skipped(self):
+        RestlerSettings({'fuzzing_mode': 'directed-smoke-test'})
+        logger.SpecCoverageLog()
+        self.append_coverage(logger.SPECCOV_ALL_COMBINATIONS_FILE, [
+            ("get_1", coverage_entry("GET /city", 1)),
+        ])
+        # The run was stopped while a line was written
+        with open(logger.get_incremental_speccov_path(logger.SPECCOV_ALL_COMBINATIONS_FILE), 'ab') as file:
+            file.write(b'{"put_1": {"verb": "PUT"')
+
+        logger.write_speccov_files()
+
+        self.assertEqual(self.load_json(logger.SPECCOV_ALL_COMBINATIONS_FILE), {"get_1": coverage_entry("GET /city", 1)})
+        self.assertEqual(self.load_json('speccov.json'), {"get_1": coverage_entry("GET /city", 1)})
+
+    def test_summary_is_skipped_when_coverage_cannot_be_loaded(self):
+        RestlerSettings({'fuzzing_mode': 'directed-smoke-test'})
+        logger.SpecCoverageLog()
+        os.remove(logger.get_incremental_speccov_path(logger.SPECCOV_ALL_COMBINATIONS_FILE))
+
+        # The missing coverage is reported without exiting
+        logger.write_speccov_files()
+
+        self.assertEqual(self.load_json(logger.SPECCOV_MIN_FILE), {})
+        self.assertFalse(os.path.exists(os.path.join(logger.LOGS_DIR, 'speccov.json')))
+
+    def test_files_are_written_at_exit_when_coverage_changed(self):
+        RestlerSettings({'fuzzing_mode': 'bfs'})
+        spec_coverage_log = logger.SpecCoverageLog()
+        speccov_path = os.path.join(logger.LOGS_DIR, logger.SPECCOV_ALL_COMBINATIONS_FILE)
+
+        self.append_coverage(logger.SPECCOV_ALL_COMBINATIONS_FILE, [
+            ("get_1", coverage_entry("GET /city", 1)),
+        ])
+        spec_coverage_log._renderings_logged["get_1"] = 1
+        # The run is stopped before the files are written
+        logger._write_speccov_files_at_exit()
+        self.assertEqual(self.load_json(logger.SPECCOV_ALL_COMBINATIONS_FILE), {"get_1": coverage_entry("GET /city", 1)})
+
+        # The files are not written again when no coverage was logged since
+        os.remove(speccov_path)
+        logger._write_speccov_files_at_exit()
+        self.assertFalse(os.path.exists(speccov_path))
+
+        self.append_coverage(logger.SPECCOV_ALL_COMBINATIONS_FILE, [
+            ("put_1", coverage_entry("PUT /city", 0)),
+        ])
+        spec_coverage_log._renderings_logged["put_1"] = 0
+        logger._write_speccov_files_at_exit()
+        self.assertEqual(list(self.load_json(logger.SPECCOV_ALL_COMBINATIONS_FILE).keys()), ["get_1", "put_1"])
+
+    def test_nothing_is_written_at_exit_without_spec_coverage_log(self):
+        logger._write_speccov_files_at_exit()
+        self.assertEqual(os.listdir(logger.LOGS_DIR), [])
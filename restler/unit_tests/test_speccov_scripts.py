@@ -0,0 +1,212 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+""" Tests for the spec coverage post-processing scripts in utilities/speccovparsing. """
+
+import unittest
+import os
+import sys
+import json
+import math
+import tempfile
+import subprocess
+from contextlib import redirect_stdout
+from io import StringIO
+
+Speccov_Scripts_Dir = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                   "..", "..", "utilities", "speccovparsing")
+sys.path.append(Speccov_Scripts_Dir)
+import speccov_json
+import diff_speccov
+
+def coverage_entry(verb_endpoint, valid):
+    return {
+        'verb_endpoint': verb_endpoint,
+        'valid': valid,
+        'invalid_due_to_sequence_failure': 0,
+        'invalid_due_to_resource_failure': 0,
+        'invalid_due_to_parser_failure': 0,
+        'invalid_due_to_500': 1 - valid,
+        'sample_request': {'request_sent_timestamp': None}
+    }
+
+class SpeccovScriptsTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_json(self, file_name, data):
+        file_path = os.path.join(self.temp_dir.name, file_name)
+        with open(file_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file)
+        return file_path
+
+    def run_script(self, script_name, *args):
+        return subprocess.run([sys.executable, os.path.join(Speccov_Scripts_Dir, script_name), *args],
+                              cwd=self.temp_dir.name, capture_output=True, text=True, check=True)
+
+    def test_diff_speccov_multiple_right_files(self):
+        left_file = self.write_json("left.json", {"get": coverage_entry("GET /city", 1),
+                                                  "put": coverage_entry("PUT /city", 1)})
+        right_files = [
+            self.write_json("right_0.json", {"get": coverage_entry("GET /city", 0),
+                                             "put": coverage_entry("PUT /city", 1)}),
+            os.path.join(self.temp_dir.name, "missing.json"),
+            self.write_json("right_1.json", {"get": coverage_entry("GET /city", 1),
+                                             "put": coverage_entry("PUT /city", 1)}),
+            self.write_json("right_2.json", {"get": coverage_entry("GET /city", 1)}),
+        ]
+        output_file = os.path.join(self.temp_dir.name, "diffs.json")
+
+        result = self.run_script("diff_speccov.py", "--left_file", left_file,
+                                 "--right_files", *right_files, "--output_file", output_file)
+
+        # The missing file is reported and skipped, and the files without differences are not listed
+        self.assertIn(f"Failed to load right file {right_files[1]}", result.stdout)
+        with open(output_file, 'r', encoding='utf-8') as file:
+            diffs = json.load(file)
+        self.assertEqual(diffs, [
+            right_files[0], {"GET /city": {"valid": {"left": 1, "right": 0},
+                                           "invalid_due_to_500": {"left": 0, "right": 1}}},
+            right_files[3], {"requests_left_only": ["PUT /city"]}
+        ])
+
+    def test_load_json(self):
+        coverage = {"get": coverage_entry("GET /city", 1), "put": coverage_entry("PUT /city", 0)}
+        file_path = self.write_json("speccov.json", coverage)
+        loaded = speccov_json.load_json(file_path)
+        self.assertEqual(loaded, coverage)
+        self.assertEqual(list(loaded.keys()), ["get", "put"])
+
+    def test_load_json_falls_back_for_non_standard_json(self):
+        file_path = os.path.join(self.temp_dir.name, "nan.json")
+        with open(file_path, 'w', encoding='utf-8') as file:
+            file.write('{"value": NaN}')
+        self.assertTrue(math.isnan(speccov_json.load_json(file_path)["value"]))
+
+    def test_dump_json(self):
+        file_path = os.path.join(self.temp_dir.name, "output.json")
+        speccov_json.dump_json(["right.json", {"GET /city": {"valid": {"left": 1, "right": 0}}}], file_path)
+        with open(file_path, 'r', encoding='utf-8') as file:
+            text = file.read()
+        self.assertEqual(json.loads(text), ["right.json", {"GET /city": {"valid": {"left": 1, "right": 0}}}])
+        self.assertTrue(text.startswith('[\n  "right.json"'))
+
+    def test_sum_speccov(self):
+        spec_file = self.write_json("speccov.json", {"get_1": coverage_entry("GET /city", 0),
+                                                     "get_2": coverage_entry("GET /city", 1),
+                                                     "put": coverage_entry("PUT /city", 1)})
+        self.run_script("sum_speccov.py", "--spec_file", spec_file)
+
+        with open(os.path.join(self.temp_dir.name, "spec_total.json"), 'r', encoding='utf-8') as file:
+            totals = json.load(file)
+        self.assertEqual(totals, {
+            "final_coverage": "2 / 3",
+            "num_failed_due_to_sequence_failure": 0,
+            "num_failed_due_to_resource_failure": 0,
+            "num_failed_due_to_parser_failure": 0,
+            "num_failed_due_to_500": 1
+        })
+
+    def test_sum_speccov_empty_file(self):
+        spec_file = self.write_json("speccov.json", {})
+        self.run_script("sum_speccov.py", "--spec_file", spec_file)
+
+        with open(os.path.join(self.temp_dir.name, "spec_total.json"), 'r', encoding='utf-8') as file:
+            totals = json.load(file)
+        self.assertEqual(totals["final_coverage"], "0 / 0")
+        self.assertEqual(totals["num_failed_due_to_500"], 0)
+
+    def test_sum_speccov_invalid_file(self):
+        spec_file = os.path.join(self.temp_dir.name, "missing.json")
+        result = subprocess.run([sys.executable, os.path.join(Speccov_Scripts_Dir, "sum_speccov.py"),
+                                 "--spec_file", spec_file],
+                                cwd=self.temp_dir.name, capture_output=True, text=True)
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn("Failed to load spec file", result.stdout)
+        self.assertEqual(result.stderr, "")
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir.name, "spec_total.json")))
+
+class DiffSpeccovTest(unittest.TestCase):
+    def diff_reqs(self, left_req, right_req):
+        output = StringIO()
+        with redirect_stdout(output):
+            diffs = diff_speccov.diff_reqs(left_req, right_req)
+        return diffs, output.getvalue()
+
+    def test_diff_reqs(self):
+        left_req = coverage_entry("GET /city", 1)
+        right_req = coverage_entry("GET /city", 1)
+        right_req['sample_request'] = {'request_sent_timestamp': 100}
+        diffs, output = self.diff_reqs(left_req, right_req)
+        # The sample requests are not compared
+        self.assertEqual(diffs, {})
+        self.assertEqual(output, "")
+
+        right_req['valid'] = True
+        right_req['invalid_due_to_500'] = None
+        diffs, output = self.diff_reqs(left_req, right_req)
+        # Values of different types are different, and null is compared as a value
+        self.assertEqual(diffs, {'valid': {'left': 1, 'right': True},
+                                 'invalid_due_to_500': {'left': 0, 'right': None}})
+        self.assertEqual(output, "")
+
+    def test_diff_reqs_missing_keys(self):
+        left_req = coverage_entry("GET /city", 1)
+        right_req = coverage_entry("GET /city", 0)
+        del right_req['invalid_due_to_500']
+        right_req['extra_key'] = 0
+        diffs, output = self.diff_reqs(left_req, right_req)
+        self.assertEqual(diffs, {'valid': {'left': 1, 'right': 0}})
+        self.assertIn("WARNING: Request coverage keys do not match!", output)
+        self.assertIn("Key, invalid_due_to_500, not found in right file's request!", output)
+
+    def test_diff_files(self):
+        left_file = {"get": coverage_entry("GET /city", 1),
+                     "put": coverage_entry("PUT /city", 1),
+                     "delete": coverage_entry("DELETE /city", 0)}
+        right_file = {"get": coverage_entry("GET /city", 0),
+                      "put": coverage_entry("PUT /city", 1),
+                      "post": coverage_entry("POST /city", 1)}
+        diffs = diff_speccov.diff_files(left_file, right_file)
+        self.assertEqual(diffs, {
+            "GET /city": {"valid": {"left": 1, "right": 0},
+                          "invalid_due_to_500": {"left": 0, "right": 1}},
+            "requests_left_only": ["DELETE /city"],
+            "requests_right_only": ["POST /city"]
+        })
+        self.assertEqual(diff_speccov.diff_files(left_file, left_file), {})
+
+    def test_iter_loaded_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = []
+            for i in range(10):
+                paths.append(os.path.join(temp_dir, f"right_{i}.json"))
+                with open(paths[-1], 'w', encoding='utf-8') as file:
+                    json.dump({"index": i}, file)
+            paths.insert(3, os.path.join(temp_dir, "missing.json"))
+
+            loaded_paths = []
+            original_try_load_json = diff_speccov.try_load_json
+            def try_load_json(path):
+                loaded_paths.append(path)
+                return original_try_load_json(path)
+            diff_speccov.try_load_json = try_load_json
+            try:
+                loaded_files = diff_speccov.iter_loaded_files(paths, max_workers=2)
+                path, data, err = next(loaded_files)
+                self.assertEqual((path, data, err), (paths[0], {"index": 0}, None))
+                # Only the files up to the maximum number of workers are loaded ahead
+                self.assertLessEqual(len(loaded_paths), 3)
+
+                results = [(path, data, err)] + list(loaded_files)
+            finally:
+                diff_speccov.try_load_json = original_try_load_json
+
+        self.assertEqual([x[0] for x in results], paths)
+        self.assertEqual([x[1] for x in results], [{"index": i} for i in range(3)] + [None] +
+                                                  [{"index": i} for i in range(3, 10)])
+        self.assertIsNotNone(results[3][2])
+        self.assertEqual(sorted(loaded_paths), sorted(paths))
@@ -0,0 +1,77 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+""" Tests for the status codes monitor queries. """
+
+import unittest
+import threading
+import time
+from types import SimpleNamespace
+
+from engine.core.fuzzing_monitor import FuzzingMonitor
+from engine.core.status_codes_monitor import StatusCodesMonitor, RequestExecutionStatus, QueryResult
+
+Valid_Codes = ['200', '201']
+Fail_Codes = ['999']
+
+def make_request(hex_definition):
+    return SimpleNamespace(hex_definition=hex_definition)
+
+def make_sequence(hex_definition, length):
+    return SimpleNamespace(hex_definition=hex_definition, definition=[hex_definition],
+                           length=length, executed_requests_count=length)
+
+def make_status(request_hex, status_code, is_fully_valid=True, sequence_failure=False):
+    return RequestExecutionStatus(int(time.time()*10**6), request_hex, status_code,
+                                  is_fully_valid, sequence_failure)
+
+class StatusCodesMonitorQueryTest(unittest.TestCase):
+    def setUp(self):
+        self.monitor = StatusCodesMonitor(int(time.time()*10**6))
+        self.monitor.update(make_sequence('seq_1', 2), [
+            make_status('req_a', '201'),
+            make_status('req_b', '999', is_fully_valid=False, sequence_failure=True),
+        ], None)
+        self.monitor.update(make_sequence('seq_2', 3), [
+            make_status('req_a', '999', is_fully_valid=False),
+            make_status('req_b', '200', is_fully_valid=False),
+            make_status('req_c', '500'),
+            make_status('req_d', '200'),
+        ], None)
+        self.requests = [make_request(x) for x in ['req_d', 'req_a', 'req_c', 'req_b', 'req_missing']]
+
+    def test_batch_query_matches_single_queries(self):
+        lock = threading.Lock()
+        batch_results = self.monitor.query_response_codes_batch(self.requests, Valid_Codes, Fail_Codes, lock)
+        single_results = [self.monitor.query_response_codes(request, Valid_Codes, Fail_Codes, lock)
+                          for request in self.requests]
+        self.assertEqual(batch_results, single_results)
+        self.assertEqual(batch_results, [
+            QueryResult(valid_code=True, fully_valid=True, sequence_failure=False),
+            QueryResult(valid_code=True, fully_valid=True, sequence_failure=False),
+            # Status codes that are neither valid nor failing are not counted
+            QueryResult(valid_code=False, fully_valid=False, sequence_failure=False),
+            QueryResult(valid_code=False, fully_valid=False, sequence_failure=True),
+            QueryResult(valid_code=False, fully_valid=False, sequence_failure=False),
+        ])
+        # The lock is released after the query
+        self.assertFalse(lock.locked())
+
+    def test_batch_query_empty(self):
+        self.assertEqual(self.monitor.query_response_codes_batch([], Valid_Codes, Fail_Codes, None), [])
+        empty_monitor = StatusCodesMonitor(int(time.time()*10**6))
+        self.assertEqual(empty_monitor.query_response_codes_batch(self.requests[:2], Valid_Codes, Fail_Codes, None),
+                         [QueryResult(valid_code=False, fully_valid=False, sequence_failure=False)] * 2)
+
+    def test_batch_query_releases_lock_on_error(self):
+        lock = threading.Lock()
+        with self.assertRaises(TypeError):
+            self.monitor.query_response_codes_batch(self.requests, None, Fail_Codes, lock)
+        self.assertFalse(lock.locked())
+
+    def test_fuzzing_monitor_batch_query(self):
+        # FuzzingMonitor is a singleton, so call its wrapper on a stand-in instance
+        fuzzing_monitor = SimpleNamespace(status_codes_monitor=self.monitor)
+        self.assertEqual(FuzzingMonitor.query_status_codes_monitor_batch(fuzzing_monitor, self.requests[:2],
+                                                                         Valid_Codes, Fail_Codes),
+                         self.monitor.query_response_codes_batch(self.requests[:2], Valid_Codes, Fail_Codes, None))
@@ -0,0 +1,246 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+""" Tests for the trace database log records, reader and writer. """
+
+import unittest
+import os
+import json
+import tempfile
+import threading
+import time
+
+import utils.logger as logger
+from restler_settings import RestlerSettings
+from utils.logging.ndjson_serializer import RequestTraceLog, JsonTraceLogReader, JsonTraceLogWriter
+from utils.logging.serializer_base import TraceLogWriterBase
+from utils.logging.trace_db import TraceDatabase, TraceDatabaseThread, SequenceTracker
+
+class ListTraceLogWriter(TraceLogWriterBase):
+    """ Trace log writer that keeps the saved records in memory. """
+    def __init__(self):
+        self.batches = []
+        self.flush_count = 0
+
+    def save(self, data):
+        self.save_batch([data])
+
+    def save_batch(self, data_list):
+        self.batches.append(list(data_list))
+
+    def flush(self):
+        self.flush_count += 1
+
+    @property
+    def records(self):
+        return [record for batch in self.batches for record in batch]
+
+class RequestTraceLogTest(unittest.TestCase):
+    def test_to_dict_reflects_attribute_changes(self):
+        trace_log = RequestTraceLog(request_id="req1", tags={'tag': 'a'})
+        trace_log.request = "GET /city HTTP/1.1\r\n\r\n"
+        first_dict = trace_log.to_dict()
+        self.assertEqual(first_dict['tags'], {'request_id': 'req1', 'tag': 'a'})
+
+        trace_log.tags = {'tag': 'b'}
+        trace_log.origin = 'main_driver'
+        trace_log.sent_timestamp = 100
+        trace_log.response_json = {'name': 'city1'}
+        second_dict = trace_log.to_dict()
+        self.assertEqual(second_dict['tags'], {'request_id': 'req1', 'origin': 'main_driver', 'tag': 'b'})
+        self.assertEqual(second_dict['sent_timestamp'], 100)
+        self.assertEqual(second_dict['response_json'], {'name': 'city1'})
+
+        # Each call returns a new dictionary, which the caller may modify
+        second_dict['tags']['tag'] = 'c'
+        self.assertEqual(trace_log.to_dict()['tags']['tag'], 'b')
+        self.assertEqual(first_dict['tags']['tag'], 'a')
+
+    def test_json_bodies_round_trip(self):
+        for response_json in ["ok", {'name': 'city1'}, ["a", 1], 5, None]:
+            with self.subTest(response_json=response_json):
+                trace_log = RequestTraceLog(request_id="req1")
+                trace_log.request_json = '{"name": "city1"}'
+                trace_log.response_json = response_json
+                log_dict = logger.json_loads(logger.json_dumps_bytes(trace_log.to_dict(), indent=False))
+                self.assertEqual(log_dict['format_version'], 2)
+                loaded = RequestTraceLog.from_dict(log_dict)
+                self.assertEqual(loaded.request_json, '{"name": "city1"}')
+                self.assertEqual(loaded.response_json, response_json)
+
+    def test_from_dict_version_1(self):
+        # Version 1 records store the json bodies serialized to strings, without a format version
+        log_dict = {'request': None, 'response': "HTTP/1.1 200 OK\r\n\r\n\"ok\"",
+                    'request_json': None, 'response_json': '"ok"', 'tags': {'request_id': 'req1'}}
+        loaded = RequestTraceLog.from_dict(log_dict)
+        self.assertEqual(loaded.request_json, None)
+        self.assertEqual(loaded.response_json, "ok")
+
+        log_dict['response_json'] = '{"name": "city1"}'
+        self.assertEqual(RequestTraceLog.from_dict(log_dict).response_json, {'name': 'city1'})
+
+class JsonTraceLogReaderTest(unittest.TestCase):
+    def test_load_multiple_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_paths = [os.path.join(temp_dir, f"trace_data_{i}.ndjson") for i in range(3)]
+            for file_idx, file_path in enumerate(file_paths):
+                with open(file_path, 'wb') as file:
+                    for request_idx in range(2):
+                        trace_log = RequestTraceLog(request_id=f"req_{file_idx}_{request_idx}",
+                                                    sequence_id=f"seq_{file_idx}")
+                        trace_log.request = f"GET /city/{file_idx}/{request_idx} HTTP/1.1\r\n\r\n"
+                        trace_log.replay_blocks = [('static_string', f"/city/{file_idx}")]
+                        file.write(logger.json_dumps_bytes(trace_log.to_dict(), indent=False) + b"\n")
+                    if file_idx == 1:
+                        file.write(b"{not json\n")
+
+            trace_logs = JsonTraceLogReader(log_file_paths=file_paths).load()
+
+        # The records of all of the files are loaded in file order, and the malformed line is skipped
+        self.assertEqual([x.request_id for x in trace_logs],
+                         ["req_0_0", "req_0_1", "req_1_0", "req_1_1", "req_2_0", "req_2_1"])
+        self.assertEqual(trace_logs[3].sequence_id, "seq_1")
+        self.assertEqual(trace_logs[3].request, "GET /city/1/1 HTTP/1.1\r\n\r\n")
+        self.assertEqual(trace_logs[3].replay_blocks, [('static_string', "/city/1")])
+
+class JsonTraceLogWriterTest(unittest.TestCase):
+    def setUp(self):
+        RestlerSettings({})
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.writer = None
+
+    def tearDown(self):
+        if self.writer is not None:
+            self.writer.handler.close()
+        RestlerSettings.TEST_DeleteInstance()
+        self.temp_dir.cleanup()
+
+    def read_records(self, file_name='trace_data.ndjson'):
+        with open(os.path.join(self.temp_dir.name, file_name), 'r', encoding='utf-8') as file:
+            return [json.loads(line) for line in file]
+
+    def test_records_are_buffered_until_flush(self):
+        self.writer = JsonTraceLogWriter(root_directory=self.temp_dir.name)
+        self.writer.save({'request_id': 'req1'})
+        self.writer.save_batch([{'request_id': 'req2'}, {'request_id': 'req3'}])
+        self.assertEqual(self.read_records(), [])
+
+        self.writer.flush()
+        self.assertEqual(self.read_records(), [{'request_id': 'req1'}, {'request_id': 'req2'}, {'request_id': 'req3'}])
+        # Flushing again does not write the records twice
+        self.writer.flush()
+        self.assertEqual(len(self.read_records()), 3)
+
+    def test_records_are_written_when_the_buffer_is_full(self):
+        self.writer = JsonTraceLogWriter(root_directory=self.temp_dir.name)
+        large_value = 'x' * (JsonTraceLogWriter._FlushThreshold // 4)
+        self.writer.save_batch([{'request_id': f"req{i}", 'value': large_value} for i in range(3)])
+        self.assertEqual(self.read_records(), [])
+
+        self.writer.save({'request_id': 'req3', 'value': large_value})
+        self.assertEqual([x['request_id'] for x in self.read_records()], ['req0', 'req1', 'req2', 'req3'])
+
+    def test_log_is_rolled_over_at_the_storage_limit(self):
+        self.writer = JsonTraceLogWriter(root_directory=self.temp_dir.name, storage_limit=100)
+        self.writer.save({'request_id': 'req1', 'value': 'x' * 50})
+        self.writer.flush()
+        self.writer.save({'request_id': 'req2', 'value': 'x' * 50})
+        self.writer.flush()
+
+        self.assertEqual([x['request_id'] for x in self.read_records('trace_data.1.ndjson')], ['req1'])
+        self.assertEqual([x['request_id'] for x in self.read_records()], ['req2'])
+
+class TraceDatabaseTest(unittest.TestCase):
+    def setUp(self):
+        RestlerSettings({})
+        self.writer = ListTraceLogWriter()
+        self.db = TraceDatabase(self.writer)
+
+    def tearDown(self):
+        SequenceTracker.clear_sequence_trace()
+        RestlerSettings.TEST_DeleteInstance()
+
+    def test_record_is_not_changed_by_later_sequence_updates(self):
+        sequence_tags = {'seq_tag': 'first'}
+        replay_blocks = [('static_string', 'GET /city')]
+        SequenceTracker.set_origin('main_driver')
+        SequenceTracker.initialize_sequence_trace(combination_id=1, tags=sequence_tags)
+        SequenceTracker.initialize_request_trace(request_id='req1', combination_id=1,
+                                                 tags={'req_tag': 'first'}, replay_blocks=replay_blocks)
+        self.db.log_request_response(request="GET /city HTTP/1.1\r\n\r\n", timestamp=1)
+
+        # The fuzzing thread moves on before the record is saved
+        sequence_tags['seq_tag'] = 'second'
+        replay_blocks.append(('static_string', '/house'))
+        SequenceTracker.initialize_request_trace(request_id='req2', combination_id=1,
+                                                 tags={'req_tag': 'second'}, replay_blocks=replay_blocks)
+
+        self.db.save_log_messages()
+        record = self.writer.records[0]
+        self.assertEqual(record['tags']['request_id'], 'req1')
+        self.assertEqual(record['tags']['req_tag'], 'first')
+        self.assertEqual(record['tags']['seq_tag'], 'first')
+        self.assertEqual(record['replay_blocks'], [('static_string', 'GET /city')])
+
+    def test_queued_messages_are_saved_in_batches(self):
+        num_messages = 2 * TraceDatabase._MaxBatchSize + 10
+        for i in range(num_messages):
+            self.db.log({'request_id': i})
+
+        self.db.save_log_messages()
+        self.db.save_log_messages()
+        # The buffered messages are not flushed while there are more messages on the queue
+        self.assertEqual([len(batch) for batch in self.writer.batches],
+                         [TraceDatabase._MaxBatchSize, TraceDatabase._MaxBatchSize])
+        self.assertEqual(self.writer.flush_count, 0)
+
+        self.db.save_log_messages()
+        self.assertEqual([len(batch) for batch in self.writer.batches],
+                         [TraceDatabase._MaxBatchSize, TraceDatabase._MaxBatchSize, 10])
+        self.assertEqual(self.writer.flush_count, 1)
+        self.assertEqual([x['request_id'] for x in self.writer.records], list(range(num_messages)))
+
+    def test_finish_saves_the_queued_messages(self):
+        self.db.log({'request_id': 0})
+        self.db.log({'request_id': 1})
+        self.db.finish()
+        self.db.save_log_messages()
+        self.assertEqual(self.writer.batches, [[{'request_id': 0}, {'request_id': 1}]])
+        self.assertEqual(self.writer.flush_count, 1)
+
+    def test_finish_with_empty_queue_flushes_the_writer(self):
+        self.db.finish()
+        self.db.save_log_messages()
+        self.assertEqual(self.writer.batches, [])
+        self.assertEqual(self.writer.flush_count, 1)
+
+    def test_wait_for_empty_log_queue(self):
+        self.assertTrue(self.db.wait_for_empty_log_queue(0))
+
+        for i in range(10):
+            self.db.log({'request_id': i})
+        # Nothing takes the messages off the queue
+        start_time = time.time()
+        self.assertFalse(self.db.wait_for_empty_log_queue(0.1))
+        self.assertGreaterEqual(time.time() - start_time, 0.1)
+
+        def save_log_messages():
+            time.sleep(0.1)
+            self.db.save_log_messages()
+        save_thread = threading.Thread(target=save_log_messages)
+        save_thread.start()
+        self.assertTrue(self.db.wait_for_empty_log_queue(10))
+        save_thread.join()
+        self.assertEqual([x['request_id'] for x in self.writer.records], list(range(10)))
+
+    def test_trace_database_thread_finish(self):
+        trace_db_thread = TraceDatabaseThread(self.db)
+        trace_db_thread.start()
+        for i in range(3 * TraceDatabase._MaxBatchSize):
+            self.db.log({'request_id': i})
+
+        trace_db_thread.finish(10)
+        trace_db_thread.join(10)
+        self.assertFalse(trace_db_thread.is_alive())
+        self.assertEqual(len(self.writer.records), 3 * TraceDatabase._MaxBatchSize)
+        self.assertGreaterEqual(self.writer.flush_count, 1)
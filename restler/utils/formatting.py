@@ -2,13 +2,25 @@
 # Licensed under the MIT License.
 
 from datetime import datetime, timezone
+import threading
 import time
 
+# Thread local storage for the last formatted timestamp.
+# Timestamps have millisecond resolution, so bursts of log lines
+# within the same millisecond reuse the same formatted string.
+_timestamp_cache = threading.local()
+
 def timestamp():
     epoch = time.time()
-    ts = datetime.fromtimestamp(epoch)
+    epoch_ms = int(epoch * 1000)
+    if getattr(_timestamp_cache, 'epoch_ms', None) == epoch_ms:
+        return _timestamp_cache.value
+    ts = datetime.fromtimestamp(epoch_ms / 1000)
     # Year-Month-Day Hour:Minute:Second.millisecond
-    return ts.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+    value = ts.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+    _timestamp_cache.epoch_ms = epoch_ms
+    _timestamp_cache.value = value
+    return value
 
 def iso_timestamp():
     dt = datetime.now(timezone.utc)
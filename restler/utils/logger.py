@@ -2,23 +2,25 @@
 # Licensed under the MIT License.
 
 """ Helpers for logging. """
-from __future__ import print_function
 import os
 import sys
+import atexit
 import shutil
 import threading
 import time
 import statistics
 import json
-import types
-import copy
-import itertools
-import datetime
-from collections import OrderedDict
 from shutil import copyfile
 from collections import namedtuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import engine.primitives as primitives
+from engine.transport_layer.response import VALID_CODES
+from engine.transport_layer.response import RESTLER_INVALID_CODE
 import engine.dependencies as dependencies
 from restler_settings import Settings
 
@@ -26,6 +28,11 @@ import utils.formatting as formatting
 
 PREPROCESSING_GENERATION = -1
 POSTPROCESSING_GENERATION = -2
+# Names of the generations that are not numbered, as printed in the rendering logs
+GENERATION_NAMES = {
+    PREPROCESSING_GENERATION: "Preprocessing",
+    POSTPROCESSING_GENERATION: "Postprocessing"
+}
 
 SETTINGS_NO_TOKENS_IN_LOGS = False
 SETTINGS_SAVE_RESULTS_IN_FIXED_DIRNAME = False
@@ -71,6 +78,81 @@ LOG_TYPE_PREPROCESSING = 'preprocessing'
 LOG_TYPE_REPLAY = 'replay'
 LOG_TYPE_AUTH = 'auth'
 
+def sync_file_data(file):
+    """ Waits for the data written to a file to be persisted by the OS.
+    Uses fdatasync where it is available, which skips persisting metadata
+    that is not needed to read the data back (e.g. the modification time).
+
+    @param file: The file, which must already be flushed
+    @type  file: File object
+
+    @return: None
+    @rtype : None
+
+    """
+    if hasattr(os, 'fdatasync'):
+        os.fdatasync(file.fileno())
+    else:
+        os.fsync(file.fileno())
+
+def write_file_atomically(file_path, data):
+    """ Writes data to a file, so that readers see either the previous
+    contents of the file or all of the new data.  The data is written
+    to a temporary file, which then replaces the file.
+
+    @param file_path: The path of the file to create or overwrite
+    @type  file_path: Str
+    @param data: The data to write
+    @type  data: Bytes
+
+    @return: None
+    @rtype : None
+
+    """
+    tmp_file_path = f"{file_path}.tmp"
+    with open(tmp_file_path, "wb") as file:
+        file.write(data)
+        file.flush()
+        sync_file_data(file)
+    os.replace(tmp_file_path, file_path)
+
+def json_dumps_bytes(obj, default=None, indent=True):
+    """ Serializes an object to utf-8 encoded JSON.
+    Uses orjson when it is installed, and falls back to the json module otherwise
+    (or if orjson cannot serialize the object, e.g. due to non-string keys).
+
+    @param obj: The object to serialize
+    @type  obj: Any
+    @param default: Optional callable used to serialize unsupported objects
+    @type  default: Callable
+    @param indent: If set, the JSON is indented.  Otherwise, it is written on a single line.
+    @type  indent: Bool
+
+    @return: The JSON-encoded object
+    @rtype : Bytes
+
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            pass
+    return json.dumps(obj, default=default, indent=2 if indent else None).encode('utf-8')
+
+def json_loads(data):
+    """ Deserializes JSON text, using orjson when it is installed.
+
+    @param data: The JSON text
+    @type  data: Str or Bytes
+
+    @return: The deserialized object
+    @rtype : Any
+
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class Bug():
      def __init__(self):
 
@@ -80,7 +162,7 @@ class Bug():
        self.error_code = None
 
      def toJson(self):
-        return json.dumps(self, default=lambda o : o.__dict__, indent=4)
+        return json_dumps_bytes(self, default=lambda o : o.__dict__).decode('utf-8')
 
 class BugDetail():
     def __init__(self):
@@ -94,7 +176,7 @@ class BugDetail():
        self.request_sequence = []
 
     def toJson(self):
-        return json.dumps(self, default=lambda o : o.__dict__, indent=4)
+        return json_dumps_bytes(self, default=lambda o : o.__dict__).decode('utf-8')
 
 class BugRequest():
     def __init__(self):
@@ -110,6 +192,15 @@ Network_Auth_Log = None
 class NetworkLog(object):
     """ Implements logic for creating, chunking, and writing to network logs """
     _MaxLogSize = 1024*1024*100 # = 100MB
+    # Size of the in-memory buffer of each network log file
+    _BufferSize = 1024*1024 # = 1MB
+    # Interval, in seconds, at which buffered network logs are flushed to disk
+    _FlushInterval = 0.2
+    # All of the NetworkLog objects that were created, to be flushed periodically
+    _Instances = []
+    _InstancesLock = threading.Lock()
+    _FlushThread = None
+
     def __init__(self, log_name, thread_id):
         """ NetworkLog constructor
 
@@ -119,10 +210,29 @@ class NetworkLog(object):
         self._current_log_num = 1
         self._thread_id = thread_id
         self._log_name = str(log_name)
-        self._current_log_path = build_logfile_path(
-            NETWORK_LOGS, self._log_name, self._thread_id, self._current_log_num)
-        # create the first network logfile
-        open(self._current_log_path, 'a').close
+        # Only the log number changes across rollovers, so the rest of the path
+        # (see build_logfile_path) is computed once here
+        base, ext, tail = NETWORK_LOGS.rpartition(".txt")
+        self._log_path_prefix = f"{base}.{self._log_name}.{self._thread_id}."
+        self._log_path_suffix = f"{ext}{tail}"
+        self._current_log_path = f"{self._log_path_prefix}{self._current_log_num}{self._log_path_suffix}"
+        self._lock = threading.Lock()
+        # create the first network logfile, which is kept open for the lifetime of the log
+        self._log_file = self._open_log_file()
+        # Track the approximate size of the current logfile, to avoid querying the file system
+        # on every write.  Characters are counted instead of bytes, which is close enough
+        # to decide when to roll over to a new logfile.
+        self._size = os.path.getsize(self._current_log_path)
+
+        with NetworkLog._InstancesLock:
+            NetworkLog._Instances.append(self)
+            if NetworkLog._FlushThread is None:
+                NetworkLog._FlushThread = threading.Thread(target=NetworkLog._flush_periodically,
+                                                           name='Network Log Flusher', daemon=True)
+                NetworkLog._FlushThread.start()
+
+    def _open_log_file(self):
+        return open(self._current_log_path, 'a', encoding='utf-8', buffering=NetworkLog._BufferSize)
 
     def write(self, data):
         """ Writes to the current network log
@@ -137,16 +247,128 @@ class NetworkLog(object):
         if Settings().disable_logging:
             return
 
-        if os.path.getsize(self._current_log_path) > NetworkLog._MaxLogSize:
-            # Create a new log if the current log has grown beyond the max size
-            self._current_log_num += 1
-            self._current_log_path = build_logfile_path(
-                NETWORK_LOGS, self._log_name, self._thread_id, self._current_log_num)
+        with self._lock:
+            if self._size > NetworkLog._MaxLogSize:
+                # Create a new log if the current log has grown beyond the max size
+                self._log_file.close()
+                self._current_log_num += 1
+                self._current_log_path = f"{self._log_path_prefix}{self._current_log_num}{self._log_path_suffix}"
+                self._log_file = self._open_log_file()
+                self._size = 0
+
+            line = f"{data}\n"
+            self._log_file.write(line)
+            self._size += len(line)
+
+    def flush(self, fsync=False):
+        """ Flushes the buffered data of the current network log to disk
+
+        @param fsync: If set, also waits for the data to be persisted by the OS
+        @type  fsync: Bool
+
+        @return: None
+        @rtype : None
+
+        """
+        with self._lock:
+            if self._log_file.closed:
+                return
+            self._log_file.flush()
+            if fsync:
+                sync_file_data(self._log_file)
+
+    def close(self):
+        """ Flushes and closes the current network log, and stops flushing it
+        in the background
+
+        @return: None
+        @rtype : None
+
+        """
+        with NetworkLog._InstancesLock:
+            if self in NetworkLog._Instances:
+                NetworkLog._Instances.remove(self)
+        with self._lock:
+            self._log_file.close()
+
+    @staticmethod
+    def flush_all(fsync=False):
+        """ Flushes all of the network logs
+
+        @param fsync: If set, also waits for the data to be persisted by the OS
+        @type  fsync: Bool
+
+        @return: None
+        @rtype : None
+
+        """
+        with NetworkLog._InstancesLock:
+            network_logs = list(NetworkLog._Instances)
+        for network_log in network_logs:
+            try:
+                network_log.flush(fsync)
+            except Exception as error:
+                print(f"Exception flushing network log: {error!s}")
+
+    @staticmethod
+    def _flush_periodically():
+        while True:
+            time.sleep(NetworkLog._FlushInterval)
+            NetworkLog.flush_all()
+
+atexit.register(NetworkLog.flush_all, True)
+
+SPECCOV_ALL_COMBINATIONS_FILE = 'speccov-all-combinations.json'
+SPECCOV_MIN_FILE = 'speccov-min.json'
+
+def get_incremental_speccov_path(file_name):
+    """ Gets the path of the file that the spec coverage is incrementally logged to
+    while fuzzing, in json lines format.
+
+    @param file_name: The name of the json spec coverage file
+    @type  file_name: Str
+
+    @return: The path of the incremental spec coverage file
+    @rtype : Str
+
+    """
+    return os.path.join(LOGS_DIR, f"{os.path.splitext(file_name)[0]}.ndjson")
 
-        with open(self._current_log_path, 'a+', encoding='utf-8') as log_file:
-            print(data, file=log_file)
-            log_file.flush()
-            os.fsync(log_file.fileno())
+# The attributes of rendered request stats that contain the raw request and response
+RAW_REQUEST_STATS = frozenset(['request_str', 'response_str'])
+
+def _get_sample_request_summary(sample_request):
+    """ Gets the attributes of a sample request that are reported in the spec coverage,
+    without copying the raw request and response.
+
+    @param sample_request: The sample request
+    @type  sample_request: RenderedRequestStats
+
+    @return: The sample request attributes, by name
+    @rtype : Dict
+
+    """
+    return {k: v for k, v in vars(sample_request).items() if k not in RAW_REQUEST_STATS}
+
+def _get_failure_coverage_keys():
+    """ Gets the spec coverage key that is set for each type of request failure
+
+    @return: The spec coverage keys, by failure type
+    @rtype : Dict
+
+    """
+    if _get_failure_coverage_keys.keys is None:
+        from engine.core.requests import FailureInformation
+        _get_failure_coverage_keys.keys = {
+            FailureInformation.SEQUENCE: 'invalid_due_to_sequence_failure',
+            FailureInformation.RESOURCE_CREATION: 'invalid_due_to_resource_failure',
+            FailureInformation.PARSER: 'invalid_due_to_parser_failure',
+            FailureInformation.BUG: 'invalid_due_to_500',
+            FailureInformation.MISSING_STATUS_CODE: 'invalid_due_to_missing_response_code'
+        }
+    return _get_failure_coverage_keys.keys
+
+_get_failure_coverage_keys.keys = None
 
 class SpecCoverageLog(object):
     __instance = None
@@ -172,17 +394,20 @@ class SpecCoverageLog(object):
             raise Exception("Attempting to create a new singleton instance.")
 
         self._renderings_logged = {}
+        # The number of renderings whose coverage was logged when the json spec coverage
+        # files were last written, or None if they were not written yet
+        self._num_renderings_written = None
+        self._write_lock = threading.Lock()
 
-        # create the spec coverage file
-        file_path = os.path.join(LOGS_DIR, 'speccov-all-combinations.json')
-        if not os.path.exists(file_path):
-            with open(file_path, 'w', encoding='utf-8') as file:
-               file.write("{}")
+        # create the spec coverage files.  While fuzzing, the coverage of each request is appended
+        # to these files as one json object per line.  The json spec coverage files are generated
+        # from them at the end of the run.
+        for file_name in [SPECCOV_ALL_COMBINATIONS_FILE, SPECCOV_MIN_FILE]:
+            open(get_incremental_speccov_path(file_name), 'ab').close()
 
         SpecCoverageLog.__instance = self
 
-    def _get_request_coverage_summary_stats(self, rendered_request, req_hash, log_tracked_parameters=False,
-                                            log_raw_requests=False):
+    def _get_request_coverage_summary_stats(self, rendered_request, req_hash, log_tracked_parameters=False):
         """ Constructs a json object with the coverage information for a request
         from the rendered request.  This info will be reported in a spec coverage file.
 
@@ -196,65 +421,67 @@ class SpecCoverageLog(object):
         @rtype : Dict
 
         """
-        from engine.core.requests import FailureInformation
-
         req=rendered_request
-        coverage_data = {}
-        coverage_data[req_hash] = {}
-        req_spec = coverage_data[req_hash]
-        req_spec['verb'] = req.method
-        req_spec['endpoint'] = req.endpoint_no_dynamic_objects
-        if req.stats.matching_prefix:
-            matching_prefix = req.stats.matching_prefix
-        else:
-            matching_prefix = []
-
-        if log_raw_requests:
-            req_spec['valid'] = req.stats.valid
-            req_spec['matching_prefix'] = matching_prefix
-
-            if req.stats.sample_request:
-                req_spec['request'] = req.stats.sample_request.request_str
-                req_spec['response'] = req.stats.sample_request.response_str
-            return coverage_data
-
-        req_spec['verb_endpoint'] = f"{req.method} {req.endpoint_no_dynamic_objects}"
-        req_spec['valid'] = req.stats.valid
-        req_spec['matching_prefix'] = matching_prefix
-
-        req_spec['invalid_due_to_sequence_failure'] = 0
-        req_spec['invalid_due_to_resource_failure'] = 0
-        req_spec['invalid_due_to_parser_failure'] = 0
-        req_spec['invalid_due_to_500'] = 0
-        if req.stats.failure == FailureInformation.SEQUENCE:
-            req_spec['invalid_due_to_sequence_failure'] = 1
-        elif req.stats.failure == FailureInformation.RESOURCE_CREATION:
-            req_spec['invalid_due_to_resource_failure'] = 1
-        elif req.stats.failure == FailureInformation.PARSER:
-            req_spec['invalid_due_to_parser_failure'] = 1
-        elif req.stats.failure == FailureInformation.BUG:
-            req_spec['invalid_due_to_500'] = 1
-        elif req.stats.failure == FailureInformation.MISSING_STATUS_CODE:
-            req_spec['invalid_due_to_missing_response_code'] = 1
-        req_spec['status_code'] = req.stats.status_code
-        req_spec['status_text'] = req.stats.status_text
-        req_spec['error_message'] = req.stats.error_msg
-        req_spec['request_order'] = req.stats.request_order
-        if req.stats.sample_request:
-            req_spec['sample_request'] = copy.copy(vars(req.stats.sample_request))
-            # Remove the raw request-response pair, as they are only logged when 'log_raw_requests' is true
-            del req_spec['sample_request']['request_str']
-            del req_spec['sample_request']['response_str']
-        if req.stats.sequence_failure_sample_request:
-            req_spec['sequence_failure_sample_request'] = copy.copy(vars(req.stats.sequence_failure_sample_request))
-            del req_spec['sequence_failure_sample_request']['request_str']
-            del req_spec['sequence_failure_sample_request']['response_str']
+        stats = req.stats
+        matching_prefix = stats.matching_prefix or []
+
+        req_spec = {
+            'verb': req.method,
+            'endpoint': req.endpoint_no_dynamic_objects,
+            'verb_endpoint': f"{req.method} {req.endpoint_no_dynamic_objects}",
+            'valid': stats.valid,
+            'matching_prefix': matching_prefix,
+            'invalid_due_to_sequence_failure': 0,
+            'invalid_due_to_resource_failure': 0,
+            'invalid_due_to_parser_failure': 0,
+            'invalid_due_to_500': 0
+        }
+        failure_key = _get_failure_coverage_keys().get(stats.failure)
+        if failure_key is not None:
+            req_spec[failure_key] = 1
+        req_spec['status_code'] = stats.status_code
+        req_spec['status_text'] = stats.status_text
+        req_spec['error_message'] = stats.error_msg
+        req_spec['request_order'] = stats.request_order
+        # The raw request-response pairs are removed, as they are only logged in the raw requests summary
+        if stats.sample_request:
+            req_spec['sample_request'] = _get_sample_request_summary(stats.sample_request)
+        if stats.sequence_failure_sample_request:
+            req_spec['sequence_failure_sample_request'] = _get_sample_request_summary(stats.sequence_failure_sample_request)
         if log_tracked_parameters:
-            req_spec['tracked_parameters'] = {}
-            for k, v in req.stats.tracked_parameters.items():
-                req_spec['tracked_parameters'][k] = v
+            req_spec['tracked_parameters'] = dict(stats.tracked_parameters)
 
-        return coverage_data
+        return {req_hash: req_spec}
+
+    @staticmethod
+    def _get_raw_requests_coverage(rendered_request, coverage_data):
+        """ Projects the coverage information for a request onto an abbreviated summary,
+        which includes whether the request passed or failed and the request and response text.
+
+        @param rendered_request: The rendered request.
+        @type  rendered_request: Request
+        @param coverage_data: The coverage data returned by _get_request_coverage_summary_stats
+        @type  coverage_data: Dict
+
+        @return: A dictionary containing a single entry with the key set to the request hash,
+                 and the value to a dictionary with the abbreviated coverage data.
+        @rtype : Dict
+
+        """
+        raw_coverage_data = {}
+        for req_hash, req_spec in coverage_data.items():
+            raw_req_spec = {
+                'verb': req_spec['verb'],
+                'endpoint': req_spec['endpoint'],
+                'valid': req_spec['valid'],
+                'matching_prefix': req_spec['matching_prefix']
+            }
+            sample_request = rendered_request.stats.sample_request
+            if sample_request:
+                raw_req_spec['request'] = sample_request.request_str
+                raw_req_spec['response'] = sample_request.response_str
+            raw_coverage_data[req_hash] = raw_req_spec
+        return raw_coverage_data
 
     def log_request_coverage_incremental(self, request=None, rendered_sequence=None, log_rendered_hash=True,
                                          log_raw_requests=True):
@@ -263,9 +490,8 @@ class SpecCoverageLog(object):
         If 'log_raw_requests' is set to 'True', prints an abbreviated summary of the coverage information
         that includes whether the request passed or failed and the request and response text.
 
-        Pre-requisite: the file contains a json dictionary with
-        zero or more elements.  The json object will be written into the
-        top-level object.
+        The json object is appended to the incremental spec coverage file
+        on its own line.
 
         @param request: The request, for cases when a sequence could not be rendered due to dependency failures.
         @type  rendered_sequence: Request
@@ -286,29 +512,12 @@ class SpecCoverageLog(object):
         """
 
         def write_incremental_coverage(file_path, req_coverage):
-            if not os.path.exists(file_path):
-                with open(file_path, 'w', encoding='utf-8') as file:
-                    file.write("{}")
-
-            coverage_as_json = json.dumps(req_coverage, indent=4)
-            # remove the start and end brackets, since they will already be present
-            # also remove the end newline
-            coverage_as_json = coverage_as_json[1:len(coverage_as_json) - 2]
-
-            with open(file_path, 'r+', encoding='utf-8') as file:
-                pos = file.seek(0, os.SEEK_END)
-                file_size = file.tell()
-                pos = file.seek(file_size - 1, 0)
-
-                if file_size > 2:
-                    file.write(",")
-                file.write(coverage_as_json)
-                file.write("}")
+            with open(file_path, 'ab') as file:
+                file.write(json_dumps_bytes(req_coverage, indent=False) + b"\n")
 
         if Settings().disable_logging:
             return
 
-        from engine.core.requests import FailureInformation
         if rendered_sequence:
             req=rendered_sequence.sequence.last_request
         else:
@@ -332,54 +541,108 @@ class SpecCoverageLog(object):
         req_coverage = self._get_request_coverage_summary_stats(req, req_hash, log_tracked_parameters=log_rendered_hash)
         self._renderings_logged[req_hash] = req_coverage[req_hash]['valid']
 
-        file_path = os.path.join(LOGS_DIR, 'speccov-all-combinations.json')
+        file_path = get_incremental_speccov_path(SPECCOV_ALL_COMBINATIONS_FILE)
         write_incremental_coverage(file_path, req_coverage)
 
-        req_coverage = self._get_request_coverage_summary_stats(req, req_hash, log_tracked_parameters=log_rendered_hash,
-                                                                log_raw_requests=True)
-        file_path = os.path.join(LOGS_DIR, 'speccov-min.json')
+        req_coverage = self._get_raw_requests_coverage(req, req_coverage)
+        file_path = get_incremental_speccov_path(SPECCOV_MIN_FILE)
         write_incremental_coverage(file_path, req_coverage)
 
-    def generate_summary_speccov(self):
+    def _load_incremental_coverage(self, file_name):
+        """ Loads the coverage logged so far to the incremental spec coverage file
+
+        @param file_name: The name of the json spec coverage file
+        @type  file_name: Str
+
+        @return: The spec coverage, keyed by request hash, in the order it was logged
+        @rtype : Dict
+
+        """
+        coverage = {}
+        with open(get_incremental_speccov_path(file_name), 'rb') as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                try:
+                    coverage.update(json_loads(line))
+                except ValueError:
+                    # The last line may be incomplete if the run was stopped while it was written
+                    print(f"Skipping invalid line in {get_incremental_speccov_path(file_name)}.")
+        return coverage
+
+    def write_speccov_files(self):
+        """ Generates the json spec coverage files from the coverage logged to the
+        incremental spec coverage files.  This is done when fuzzing ends, and at exit
+        if more coverage was logged since then (e.g. if the run was stopped).
+        In smoke test mode, the summary spec coverage file (speccov.json) is also generated.
+
+        @return: None
+        @rtype : None
+
+        """
+        with self._write_lock:
+            self._num_renderings_written = len(self._renderings_logged)
+            coverage_by_file = {}
+            for file_name in [SPECCOV_ALL_COMBINATIONS_FILE, SPECCOV_MIN_FILE]:
+                try:
+                    coverage = self._load_incremental_coverage(file_name)
+                except Exception as error:
+                    print(f"Cannot load {get_incremental_speccov_path(file_name)}: {error!s}.")
+                    continue
+                with open(os.path.join(LOGS_DIR, file_name), 'wb') as file:
+                    file.write(json_dumps_bytes(coverage))
+                coverage_by_file[file_name] = coverage
+
+            if Settings().in_smoke_test_mode():
+                self.generate_summary_speccov(coverage_by_file.get(SPECCOV_ALL_COMBINATIONS_FILE))
+
+    def write_speccov_files_if_changed(self):
+        """ Generates the json spec coverage files, unless they were already generated
+        from all of the coverage logged so far.
+
+        @return: None
+        @rtype : None
+
+        """
+        if self._num_renderings_written != len(self._renderings_logged):
+            self.write_speccov_files()
+
+    def generate_summary_speccov(self, full_speccov):
         """ Generate a speccov file that contains one entry for each request, which contains whether the request
             is valid and a sample request.
+
+        @param full_speccov: The coverage of all combinations, or None if it could not be loaded
+        @type  full_speccov: Dict
+
+        @return: None
+        @rtype : None
+
         """
-        file_path = os.path.join(LOGS_DIR, 'speccov-all-combinations.json')
+        file_path = os.path.join(LOGS_DIR, SPECCOV_ALL_COMBINATIONS_FILE)
         new_file_path = os.path.join(LOGS_DIR, 'speccov.json')
 
+        if full_speccov is None:
+            print(f"Cannot load {get_incremental_speccov_path(SPECCOV_ALL_COMBINATIONS_FILE)}.")
+            return
+
         if Settings().fuzzing_mode == 'test-all-combinations':
             shutil.copyfile(file_path, new_file_path)
             return
             # The speccov file has the same content as speccov-all-combinations.  Simply copy it.
 
-        try:
-            full_speccov = json.load(open(file_path, encoding='utf-8'))
-        except Exception as error:
-            print(f"Cannot load {file_path}: {error!s}.")
-            sys.exit(-1)
-
-        def get_verb_endpoint(item):
-            (k, v) = item
-            return v['verb_endpoint']
-
-        def is_valid(item):
-            (k, v) = item
-            return v['valid']
-
-        new_speccov = {}
-        for key, group in itertools.groupby(full_speccov.items(), get_verb_endpoint):
-            req_type_results = [x for x in group]
-
-            valid_results = list(filter(is_valid, req_type_results))
-            if len(valid_results) > 0:
-                (k, v) = valid_results[0]
-            else:
-                # Record the first result in the spec coverage file
-                # This is helpful when example payloads are used, since they are attempted first
-                (k, v) = req_type_results[0]
-            new_speccov[k] = v
+        # Select one result for each request type in a single pass: the first valid result, or
+        # the first result if none are valid.
+        # Recording the first result is helpful when example payloads are used, since they are attempted first
+        selected_results = {}
+        for k, v in full_speccov.items():
+            verb_endpoint = v['verb_endpoint']
+            selected = selected_results.get(verb_endpoint)
+            if selected is None or (v['valid'] and not selected[1]['valid']):
+                selected_results[verb_endpoint] = (k, v)
+        new_speccov = dict(selected_results.values())
 
-        json.dump(new_speccov, open(new_file_path, 'w', encoding='utf-8'), indent=4)
+        with open(new_file_path, 'wb') as file:
+            file.write(json_dumps_bytes(new_speccov))
 
 def no_tokens_in_logs():
     """ Do not print token data in logs
@@ -455,8 +718,8 @@ def build_logfile_path(logname, logType, threadId, log_num=1):
     @rtype : Str
 
     """
-    typeStart = logname.rfind(".txt")
-    return f"{logname[:typeStart]}.{logType}.{threadId!s}.{log_num!s}{logname[typeStart:]}"
+    base, ext, tail = logname.rpartition(".txt")
+    return f"{base}.{logType}.{threadId}.{log_num}{ext}{tail}"
 
 def remove_tokens_from_logs(data):
     """ If the no-tokens-in-logs setting is set, this function will attempt to
@@ -468,11 +731,54 @@ def remove_tokens_from_logs(data):
 
     """
     global SETTINGS_NO_TOKENS_IN_LOGS
-    from engine.core.request_utilities import replace_auth_token
     if SETTINGS_NO_TOKENS_IN_LOGS:
+        from engine.core.request_utilities import replace_auth_token
         data = replace_auth_token(data, '_OMITTED_AUTH_TOKEN_')
     return data
 
+# Set of log directories that are known to exist
+Created_Log_Dirs = set()
+
+# Append handles of the log files that are written to repeatedly, keyed by path.
+# Keeping them open avoids an open/close pair for every write.
+Log_Handles = dict()
+Log_Handles_Lock = threading.Lock()
+
+def append_to_log(filename, data):
+    """ Appends data to a log file through a cached handle and flushes it,
+    so the data is visible to readers of the log immediately.
+
+    @param filename: The path of the log file
+    @type  filename: Str
+    @param data: The data to append
+    @type  data: Str
+
+    @return: None
+    @rtype : None
+
+    """
+    with Log_Handles_Lock:
+        log_file = Log_Handles.get(filename)
+        if log_file is None:
+            log_file = open(filename, "a", encoding='utf-8')
+            Log_Handles[filename] = log_file
+        log_file.write(data)
+        log_file.flush()
+
+def close_log_handles():
+    """ Closes the cached log file handles
+
+    @return: None
+    @rtype : None
+
+    """
+    with Log_Handles_Lock:
+        for log_file in Log_Handles.values():
+            log_file.close()
+        Log_Handles.clear()
+
+atexit.register(close_log_handles)
+
 def garbage_collector_logging(msg):
     """ Helper to log garbage collection stats.
 
@@ -485,17 +791,78 @@ def garbage_collector_logging(msg):
     """
     thread_id = threading.current_thread().ident
     filename = build_logfile_path(GARBAGE_COLLECTOR_LOGS, LOG_TYPE_GC, str(thread_id))
-    if not os.path.exists(os.path.dirname(filename)):
+    log_dir = os.path.dirname(filename)
+    if log_dir not in Created_Log_Dirs:
         try:
-            os.makedirs(os.path.dirname(filename))
+            os.makedirs(log_dir, exist_ok=True)
+            Created_Log_Dirs.add(log_dir)
         except OSError:
             pass
-    with open(filename, "a+", encoding='utf-8') as log_file:
-        print(msg, file=log_file)
+    append_to_log(filename, f"{msg}\n")
+
+class MainLogBuffer(object):
+    """ Buffers the lines written to the main log by all of the threads.  The lines are
+    kept in a single buffer, so they are written to the log in the order they were logged.
+    """
+    # Interval, in seconds, at which the buffered lines are written to the main log
+    _FlushInterval = 0.1
+    _Lines = []
+    # Protects the buffered lines
+    _Lock = threading.Lock()
+    # Serializes the writes to the main log file, so that lines taken off the buffer
+    # by one flush are written before the lines taken off by the next one
+    _WriteLock = threading.Lock()
+    _FlushThread = None
+
+    @staticmethod
+    def append(data):
+        """ Appends a line to the buffer
+
+        @param data: The line to append
+        @type  data: Str
+
+        @return: None
+        @rtype : None
+
+        """
+        with MainLogBuffer._Lock:
+            MainLogBuffer._Lines.append(data)
+            if MainLogBuffer._FlushThread is None:
+                MainLogBuffer._FlushThread = threading.Thread(target=MainLogBuffer._flush_periodically,
+                                                              name='Main Log Flusher', daemon=True)
+                MainLogBuffer._FlushThread.start()
+
+    @staticmethod
+    def flush_all():
+        """ Writes the buffered lines to the main log
+
+        @return: None
+        @rtype : None
+
+        """
+        if MAIN_LOGS is None:
+            return
+        with MainLogBuffer._WriteLock:
+            with MainLogBuffer._Lock:
+                lines, MainLogBuffer._Lines = MainLogBuffer._Lines, []
+            if not lines:
+                return
+            try:
+                append_to_log(MAIN_LOGS, "".join(lines))
+            except Exception as err:
+                print(f"Exception writing to main log: {err!s}")
+
+    @staticmethod
+    def _flush_periodically():
+        while True:
+            time.sleep(MainLogBuffer._FlushInterval)
+            MainLogBuffer.flush_all()
+
+atexit.register(MainLogBuffer.flush_all)
 
-main_lock = threading.Semaphore(1)
 def write_to_main(data: str, print_to_console: bool=False):
-    """ Writes to the main log
+    """ Writes to the main log.  The data is buffered and written to the log
+    file in the background, in the order it was logged.
 
     @param data: The data to write
     @param print_to_console: If true, print to console as well as log
@@ -505,17 +872,11 @@ def write_to_main(data: str, print_to_console: bool=False):
     """
     if Settings().disable_logging:
         return
-    try:
-        main_lock.acquire()
-        with open(MAIN_LOGS, "a+", encoding='utf-8') as f:
-            print(data, file=f)
-            f.flush()
-    except Exception as err:
-        print(f"Exception writing to main log: {err!s}")
-    finally:
-        main_lock.release()
+    MainLogBuffer.append(f"{data}\n")
 
     if print_to_console:
+        # Write out the buffered lines first, so the main log is never behind the console
+        MainLogBuffer.flush_all()
         print(data)
 
 def create_network_log(log_name):
@@ -617,6 +978,60 @@ def custom_network_logging(sequence, candidate_values_pool, **kwargs):
         network_log.write(print_data)
     network_log.write("")
 
+def write_chunks_to_file(file_path, chunks):
+    """ Writes a list of strings to a new file, with a single gathering write
+    where the platform supports it.
+
+    @param file_path: The path of the file to create or overwrite
+    @type  file_path: Str
+    @param chunks: The strings to write
+    @type  chunks: List[Str]
+
+    @return: None
+    @rtype : None
+
+    """
+    if not hasattr(os, 'writev'):
+        with open(file_path, "w+", encoding='utf-8') as file:
+            file.write("".join(chunks))
+        return
+
+    encoded_chunks = [chunk.encode('utf-8') for chunk in chunks]
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if len(encoded_chunks) <= os.sysconf('SC_IOV_MAX'):
+            written = os.writev(fd, encoded_chunks)
+        else:
+            written = 0
+        # Complete partial writes
+        remaining = b""
+        if written < sum(len(chunk) for chunk in encoded_chunks):
+            remaining = b"".join(encoded_chunks)[written:]
+        while remaining:
+            written = os.write(fd, remaining)
+            remaining = remaining[written:]
+    finally:
+        os.close(fd)
+
+BUG_REPLAY_LOG_HEADER_LEN = 80
+# The header of each bug bucket replay log.
+# Note: the braces are format fields, filled in when the bug is logged.
+BUG_REPLAY_LOG_HEADER = (
+    f"{'#' * BUG_REPLAY_LOG_HEADER_LEN}\n"
+    " {name_header}\n\n"
+    "{additional_log_header}"
+    " Hash: {bug_hash}\n\n"
+    " To attempt to reproduce this bug using restler, run restler with the command\n"
+    " line option of --replay_log <path_to_this_log>.\n"
+    " If an authentication token is required, you must also specify the token_refresh_cmd.\n"
+    "\n This log may contain specific values for IDs or names that were generated\n"
+    " during fuzzing, using the fuzzing dictionary. Such names will be re-played\n"
+    " without modification. You must update the replay log manually with any changes\n"
+    " required to execute the requests in your environment (for example, replacing\n"
+    " pre-created account, subscription, or other resource IDs, as needed).\n"
+    f"{'#' * BUG_REPLAY_LOG_HEADER_LEN}\n\n"
+)
+
 BugTuple = namedtuple('BugTuple', ['filename_of_replay_log', 'bug_hash', 'reproduce_attempts', 'reproduce_successes'])
 # Dict to track whether or not a bug was already logged:
 #   {"{seq_hash}_{bucket_class}": BugTuple()}
@@ -624,6 +1039,83 @@ Bugs_Logged = dict()
 # Dict of bug hashes to be printed to bug_buckets.json
 #   {bug_hash: {"file_path": replay_log_relative_path}}
 Bug_Hashes = dict()
+# File to which each new entry of Bug_Hashes is appended, in json lines format
+# (bug_buckets.ndjson, next to bug_buckets.json).  Its writes are buffered, and it is
+# flushed each time bug_buckets.json is written.
+Bug_Hashes_Log = None
+BUG_HASHES_LOG_BUFFER_SIZE = 1 << 16
+# Number of bug hashes added since bug_buckets.json was last written
+Bug_Hashes_Unsaved = 0
+# bug_buckets.json is rewritten after this many new bug hashes, so that it stays
+# close to up to date even if the run is killed before the exit handlers run
+BUG_HASHES_SAVE_INTERVAL = 50
+
+def write_bug_hashes(close_log=False):
+    """ Writes the bug hashes found during the run to bug_buckets.json,
+    and flushes the bug hashes log
+
+    @param close_log: If set, also closes the bug hashes log (at exit)
+    @type  close_log: Bool
+
+    @return: None
+    @rtype : None
+
+    """
+    global Bug_Hashes_Log, Bug_Hashes_Unsaved
+    if Bug_Hashes_Log is None:
+        return
+    try:
+        Bug_Hashes_Log.flush()
+        with open(os.path.join(BUG_BUCKETS_DIR, "bug_buckets.json"), "wb") as hash_json:
+            hash_json.write(json_dumps_bytes(Bug_Hashes))
+        Bug_Hashes_Unsaved = 0
+    except Exception as error:
+        print(f"Exception writing bug hashes: {error!s}")
+    if close_log:
+        Bug_Hashes_Log.close()
+        Bug_Hashes_Log = None
+
+atexit.register(write_bug_hashes, True)
+
+def add_bug_hash(bug_hash, replay_filename):
+    """ Adds a bug hash and appends it to the bug hashes log.
+    bug_buckets.json is generated from the bug hashes periodically and at exit.
+
+    @param bug_hash: The unique hash of the bug
+    @type  bug_hash: Str
+    @param replay_filename: The name of the bug's replay log
+    @type  replay_filename: Str
+
+    @return: None
+    @rtype : None
+
+    """
+    global Bug_Hashes_Log, Bug_Hashes_Unsaved
+    Bug_Hashes[bug_hash] = {"file_path": replay_filename}
+    if Bug_Hashes_Log is None:
+        Bug_Hashes_Log = open(os.path.join(BUG_BUCKETS_DIR, "bug_buckets.ndjson"), "wb",
+                              buffering=BUG_HASHES_LOG_BUFFER_SIZE)
+    Bug_Hashes_Log.write(json_dumps_bytes({bug_hash: Bug_Hashes[bug_hash]}, indent=False) + b"\n")
+    Bug_Hashes_Unsaved += 1
+    if Bug_Hashes_Unsaved >= BUG_HASHES_SAVE_INTERVAL:
+        write_bug_hashes()
+
+def escape_payload(payload):
+    """ Returns the repr of a payload without its enclosing quotes.
+    Strings that repr would leave unchanged are returned as they are,
+    which avoids building their repr.
+
+    @param payload: The payload of a request block
+    @type  payload: Any
+
+    @return: The escaped payload
+    @rtype : Str
+
+    """
+    if isinstance(payload, str) and payload.isprintable() and\
+       '\\' not in payload and "'" not in payload:
+        return payload
+    return repr(payload)[1:-1]
 
 def update_bug_buckets(bug_buckets, bug_request_data, bug_hash, additional_log_str=None):
     """
@@ -640,7 +1132,7 @@ def update_bug_buckets(bug_buckets, bug_request_data, bug_hash, additional_log_s
     @rtype : None
 
     """
-    Header_Len = 80
+    Header_Len = BUG_REPLAY_LOG_HEADER_LEN
     def get_bug_filename(file_extension):
         return f"{bucket_class}_{len(bug_buckets[bucket_class].keys())}.{file_extension}"
 
@@ -649,35 +1141,20 @@ def update_bug_buckets(bug_buckets, bug_request_data, bug_hash, additional_log_s
         filename = get_bug_filename("replay.txt")
         filepath = os.path.join(BUG_BUCKETS_DIR, filename)
 
-        with open(filepath, "w+", encoding='utf-8') as bug_file:
-            # Print the header
-            print(f"{'#' * Header_Len}", file=bug_file)
-            print(f" {name_header}\n", file=bug_file)
-            if additional_log_str is not None:
-                print(f" {additional_log_str}\n", file=bug_file)
-            print(f" Hash: {bug_hash}\n", file=bug_file)
-            print(" To attempt to reproduce this bug using restler, run restler with the command", file=bug_file)
-            print(" line option of --replay_log <path_to_this_log>.", file=bug_file)
-            print(" If an authentication token is required, you must also specify the token_refresh_cmd.", file=bug_file)
-            print("\n This log may contain specific values for IDs or names that were generated", file=bug_file)
-            print(" during fuzzing, using the fuzzing dictionary. Such names will be re-played", file=bug_file)
-            print(" without modification. You must update the replay log manually with any changes", file=bug_file)
-            print(" required to execute the requests in your environment (for example, replacing", file=bug_file)
-            print(" pre-created account, subscription, or other resource IDs, as needed).", file=bug_file)
-            print(f"{'#' * Header_Len}\n", file=bug_file)
-
-            # Print each of the sent requests
-            for req in bug_request_data:
-                data = repr(req.rendered_data).strip("'")
-                print(f'{REPLAY_REQUEST_INDICATOR}{data}', file=bug_file)
-                print(f"{BUG_LOG_NOTIFICATION_ICON}producer_timing_delay {req.producer_timing_delay}", file=bug_file)
-                print(f"{BUG_LOG_NOTIFICATION_ICON}max_async_wait_time {req.max_async_wait_time}", file=bug_file)
-                print(f"PREVIOUS RESPONSE: {req.response!r}\n", file=bug_file)
-
-            log_file.flush()
-            os.fsync(log_file.fileno())
-
-            return filename
+        # Print the header, followed by each of the sent requests
+        additional_log_header = f" {additional_log_str}\n\n" if additional_log_str is not None else ""
+        chunks = [BUG_REPLAY_LOG_HEADER.format(name_header=name_header,
+                                               additional_log_header=additional_log_header,
+                                               bug_hash=bug_hash)]
+        for req in bug_request_data:
+            data = repr(req.rendered_data).strip("'")
+            chunks.append(f'{REPLAY_REQUEST_INDICATOR}{data}\n'
+                          f"{BUG_LOG_NOTIFICATION_ICON}producer_timing_delay {req.producer_timing_delay}\n"
+                          f"{BUG_LOG_NOTIFICATION_ICON}max_async_wait_time {req.max_async_wait_time}\n"
+                          f"PREVIOUS RESPONSE: {req.response!r}\n\n")
+        write_chunks_to_file(filepath, chunks)
+
+        return filename
 
     def log_new_bug_as_json():
         # Create the new bug log in json format
@@ -717,38 +1194,38 @@ def update_bug_buckets(bug_buckets, bug_request_data, bug_hash, additional_log_s
 
         jsonString = bugDetail.toJson()
         with open(filepath, "w+", encoding='utf-8') as bug_file:
-            print(f'{jsonString}', file=bug_file)
-            log_file.flush()
-            os.fsync(log_file.fileno())
+            bug_file.write(f"{jsonString}\n")
 
         return filename
 
     def write_incremental_bugs(file_path, req_bug):
-        if not os.path.exists(file_path):
-            with open(file_path, 'w', encoding='utf-8') as file:
-                file.write("{\"bugs\":[]}")
+        try:
+            fd = os.open(file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            try:
+                os.write(fd, b"{\"bugs\":[]}")
+            finally:
+                os.close(fd)
+        except FileExistsError:
+            pass
 
-        req_bug_as_json = req_bug.toJson() # json.dumps(req_bug, indent=4)
+        req_bug_as_json = json_dumps_bytes(req_bug, default=lambda o : o.__dict__)
         # remove the start and end brackets, since they will already be present
         # also remove the end newline
         req_bug_as_json = req_bug_as_json[0:len(req_bug_as_json) - 2]
 
-        with open(file_path, 'r+', encoding='utf-8') as file:
+        with open(file_path, 'r+b') as file:
             pos = file.seek(0, os.SEEK_END)
             file_size = file.tell()
             pos = file.seek(file_size - 2, 0)
 
             if file_size > 11:
-                file.write(",")
+                file.write(b",")
             file.write(req_bug_as_json)
-            file.write("}]}")
+            file.write(b"}]}")
 
     def add_hash(replay_filename):
-        """ Helper that adds bug hash to the bug buckets json file """
-        global Bug_Hashes
-        Bug_Hashes[bug_hash] = {"file_path": replay_filename}
-        with open(os.path.join(BUG_BUCKETS_DIR, "bug_buckets.json"), "w+", encoding='utf-8') as hash_json:
-            json.dump(Bug_Hashes, hash_json, indent=4)
+        """ Helper that adds the bug hash to the bug hashes """
+        add_bug_hash(bug_hash, replay_filename)
 
     thread_id = threading.current_thread().ident
     # Create the bug_buckets directory if it doesn't yet exist
@@ -763,54 +1240,56 @@ def update_bug_buckets(bug_buckets, bug_request_data, bug_hash, additional_log_s
             pass
 
     global Bugs_Logged
-    with open(filename, "w+", encoding='utf-8') as log_file:
-        tot_count = 0
-        for bucket_class in bug_buckets:
-            print(f"{bucket_class}: {len(bug_buckets[bucket_class].keys())}", file=log_file)
-            tot_count += len(bug_buckets[bucket_class].keys())
-        print(f"Total Buckets: {tot_count}", file=log_file)
-        print("-------------", file=log_file)
-        for bucket_class in bug_buckets:
-            for seq_hash in bug_buckets[bucket_class]:
-                bug_bucket = bug_buckets[bucket_class][seq_hash]
-                bucket_hash = f"{seq_hash}_{bucket_class}"
-                name_header = bucket_class
-                if bucket_hash not in Bugs_Logged:
-                    try:
-                        filename = log_new_bug()
-                        filenameJson = log_new_bug_as_json()
-                        requestBug = Bug()
-                        requestBug.filepath = filenameJson
-                        requestBug.reproducible = bug_bucket.reproducible
-                        requestBug.checker_name = bug_bucket.origin
-                        requestBug.error_code = bug_bucket.error_code
-
-                        write_incremental_bugs(os.path.join(BUG_BUCKETS_DIR, "Bugs.json"),requestBug)
-                        Bugs_Logged[bucket_hash] = BugTuple(filename, bug_hash, bug_bucket.reproduce_attempts, bug_bucket.reproduce_successes)
-                        add_hash(filename)
-                    except Exception as error:
-                        write_to_main(f"Failed to write bug bucket log: {error!s}")
-                        filename = 'Failed to create replay log.'
-                else:
-                    filename = Bugs_Logged[bucket_hash].filename_of_replay_log
-                    this_bug_hash = Bugs_Logged[bucket_hash].bug_hash
-                    Bugs_Logged[bucket_hash] = BugTuple(filename, this_bug_hash, bug_bucket.reproduce_attempts, bug_bucket.reproduce_successes)
-
-                if bug_bucket.reproducible:
-                    print(f'{name_header} - Bug was reproduced - {filename}', file=log_file)
-                else:
-                    print(f'{name_header} - Unable to reproduce bug - {filename}', file=log_file)
-                    print(f'Attempted to reproduce {Bugs_Logged[bucket_hash].reproduce_attempts} time(s); '
-                          f'Reproduced {Bugs_Logged[bucket_hash].reproduce_successes} time(s)', file=log_file)
-                print(f"Hash: {Bugs_Logged[bucket_hash].bug_hash}", file=log_file)
-                for request in bug_bucket.sequence:
-                    for payload in list(map(lambda x: x[1], request.definition)):
-                        print(repr(payload)[1:-1], end='', file=log_file)
-                    print(file=log_file)
-                print("-" * Header_Len, file=log_file)
+    # The summary is assembled in memory and written with a single write
+    summary = []
+    tot_count = 0
+    for bucket_class in bug_buckets:
+        summary.append(f"{bucket_class}: {len(bug_buckets[bucket_class].keys())}\n")
+        tot_count += len(bug_buckets[bucket_class].keys())
+    summary.append(f"Total Buckets: {tot_count}\n")
+    summary.append("-------------\n")
+    for bucket_class in bug_buckets:
+        for seq_hash in bug_buckets[bucket_class]:
+            bug_bucket = bug_buckets[bucket_class][seq_hash]
+            bucket_hash = f"{seq_hash}_{bucket_class}"
+            name_header = bucket_class
+            if bucket_hash not in Bugs_Logged:
+                try:
+                    filename = log_new_bug()
+                    filenameJson = log_new_bug_as_json()
+                    requestBug = Bug()
+                    requestBug.filepath = filenameJson
+                    requestBug.reproducible = bug_bucket.reproducible
+                    requestBug.checker_name = bug_bucket.origin
+                    requestBug.error_code = bug_bucket.error_code
+
+                    write_incremental_bugs(os.path.join(BUG_BUCKETS_DIR, "Bugs.json"),requestBug)
+                    Bugs_Logged[bucket_hash] = BugTuple(filename, bug_hash, bug_bucket.reproduce_attempts, bug_bucket.reproduce_successes)
+                    add_hash(filename)
+                except Exception as error:
+                    write_to_main(f"Failed to write bug bucket log: {error!s}")
+                    filename = 'Failed to create replay log.'
+            else:
+                filename = Bugs_Logged[bucket_hash].filename_of_replay_log
+                this_bug_hash = Bugs_Logged[bucket_hash].bug_hash
+                Bugs_Logged[bucket_hash] = BugTuple(filename, this_bug_hash, bug_bucket.reproduce_attempts, bug_bucket.reproduce_successes)
 
+            if bug_bucket.reproducible:
+                summary.append(f'{name_header} - Bug was reproduced - {filename}\n')
+            else:
+                summary.append(f'{name_header} - Unable to reproduce bug - {filename}\n')
+                summary.append(f'Attempted to reproduce {Bugs_Logged[bucket_hash].reproduce_attempts} time(s); '
+                               f'Reproduced {Bugs_Logged[bucket_hash].reproduce_successes} time(s)\n')
+            summary.append(f"Hash: {Bugs_Logged[bucket_hash].bug_hash}\n")
+            for request in bug_bucket.sequence:
+                summary.append("".join(escape_payload(definition[1]) for definition in request.definition))
+                summary.append("\n")
+            summary.append("-" * Header_Len + "\n")
+
+    with open(BUG_BUCKET_LOGS, "w+", encoding='utf-8') as log_file:
+        log_file.write("".join(summary))
         log_file.flush()
-        os.fsync(log_file.fileno())
+        sync_file_data(log_file)
 
 def copy_stats(counter):
     """
@@ -873,9 +1352,7 @@ def print_async_results(req_data, message):
 
     req_data = remove_tokens_from_logs(req_data)
 
-    with open(ASYNC_LOG, "a+", encoding='utf-8') as f:
-        print(repr(req_data), file=f)
-        print(f"{message}\n", file=f)
+    append_to_log(ASYNC_LOG, f"{req_data!r}\n{message}\n\n")
 
 def print_req_collection_stats(req_collection, candidate_values_pool):
     """  Prints request collection evolution stats.
@@ -890,35 +1367,24 @@ def print_req_collection_stats(req_collection, candidate_values_pool):
 
     """
     timestamp = formatting.timestamp()
-    data = f"{timestamp}: Going to fuzz a set with {req_collection.size} requests\n"
-
-    for i, r in enumerate(req_collection):
-        val = r.num_combinations(candidate_values_pool)
-        data += f"{timestamp}: Request-{i}: Value Combinations: {val}\n"
-
-    val = statistics.mean([r.num_combinations(candidate_values_pool)\
-                   for r in req_collection])
-    data += f"{timestamp}: Avg. Value Combinations per Request: {val}\n"
+    lines = [f"{timestamp}: Going to fuzz a set with {req_collection.size} requests\n"]
 
-    val = statistics.median([r.num_combinations(candidate_values_pool)\
-                     for r in req_collection])
-    data += f"{timestamp}: Median Value Combinations per Request: {val}\n"
+    combinations = [r.num_combinations(candidate_values_pool) for r in req_collection]
+    for i, val in enumerate(combinations):
+        lines.append(f"{timestamp}: Request-{i}: Value Combinations: {val}\n")
 
-    val = min([r.num_combinations(candidate_values_pool)\
-                  for r in req_collection])
-    data += f"{timestamp}: Min Value Combinations per Request: {val}\n"
-
-    val = max([r.num_combinations(candidate_values_pool)\
-                  for r in req_collection])
-    data += f"{timestamp}: Max Value Combinations per Request: {val}\n"
+    lines.append(f"{timestamp}: Avg. Value Combinations per Request: {statistics.mean(combinations)}\n")
+    lines.append(f"{timestamp}: Median Value Combinations per Request: {statistics.median(combinations)}\n")
+    lines.append(f"{timestamp}: Min Value Combinations per Request: {min(combinations)}\n")
+    lines.append(f"{timestamp}: Max Value Combinations per Request: {max(combinations)}\n")
 
     val = 0
     for r in req_collection:
         val += len(r.produces)
         val += len(r.consumes)
-    data += f"{timestamp}: Total dependencies: {val}\n"
+    lines.append(f"{timestamp}: Total dependencies: {val}\n")
 
-    write_to_main(data)
+    write_to_main("".join(lines))
 
 def print_memory_consumption(req_collection, fuzzing_monitor, fuzzing_mode, generation):
     """ Prints global generation's memory consumption statistics.
@@ -977,15 +1443,13 @@ def print_generation_stats(req_collection, fuzzing_monitor, global_lock, final=F
 
     """
     from engine.bug_bucketing import BugBuckets
-    from engine.transport_layer.response import VALID_CODES
-    from engine.transport_layer.response import RESTLER_INVALID_CODE
     timestamp = formatting.timestamp()
 
     successful_requests = []
     num_fully_valid = 0
     num_sequence_failures = 0
-    for r in req_collection:
-        query_result = fuzzing_monitor.query_status_codes_monitor(r, VALID_CODES, [RESTLER_INVALID_CODE], global_lock)
+    query_results = fuzzing_monitor.query_status_codes_monitor_batch(req_collection, VALID_CODES, [RESTLER_INVALID_CODE], global_lock)
+    for query_result in query_results:
         successful_requests.append(query_result.valid_code)
         if(query_result.fully_valid):
             num_fully_valid += 1
@@ -1016,7 +1480,7 @@ def print_generation_stats(req_collection, fuzzing_monitor, global_lock, final=F
     )
 
     if final:
-        testing_summary = OrderedDict()
+        testing_summary = dict()
         testing_summary['final_spec_coverage'] = final_spec_coverage
         testing_summary['rendered_requests'] = rendered_requests
         testing_summary['rendered_requests_valid_status'] = rendered_requests_valid_status
@@ -1027,75 +1491,81 @@ def print_generation_stats(req_collection, fuzzing_monitor, global_lock, final=F
         testing_summary['total_requests_sent'] = total_requests_sent
         testing_summary['bug_buckets'] = bug_buckets
         testing_summary['reproducible_bug_buckets'] = BugBuckets.Instance().repro_bug_buckets()
-        settings_summary = OrderedDict()
+        settings_summary = dict()
         settings_summary['random_seed'] = Settings().random_seed
         testing_summary['settings'] = settings_summary
-        with open(os.path.join(LOGS_DIR, "testing_summary.json"), "w+", encoding='utf-8') as summary_json:
-            json.dump(testing_summary, summary_json, indent=4)
+        write_file_atomically(os.path.join(LOGS_DIR, "testing_summary.json"), json_dumps_bytes(testing_summary))
 
 
 def print_gc_summary(garbage_collector):
     """ Prints the summary of garbage collection statistics.
     """
-    gc_summary = OrderedDict()
+    gc_summary = dict()
     gc_summary['delete_stats'] = garbage_collector.gc_stats
-    with open(os.path.join(LOGS_DIR, "gc_summary.json"), "w+", encoding='utf-8') as summary_json:
-        json.dump(gc_summary, summary_json, indent=4)
+    write_file_atomically(os.path.join(LOGS_DIR, "gc_summary.json"), json_dumps_bytes(gc_summary))
 
 
-def format_request_block(request_id, request_block, candidate_values_pool):
+def _format_fuzzable_uuid4_block(request_id, request_block, candidate_values_pool):
+    # Dynamic primitive that needs fresh rendering every time
+    return request_block[0], (primitives.restler_fuzzable_uuid4,), request_block[1]
+
+def _format_fuzzable_group_block(request_id, request_block, candidate_values_pool):
+    # Enums have a list of values instead of one default val
+    default_val = request_block[2]
+    return request_block[0], list(default_val), default_val
+
+def _format_multipart_formdata_block(request_id, request_block, candidate_values_pool):
+    return request_block[0], ('_OMITTED_BINARY_DATA_',), '_OMITTED_BINARY_DATA_'
+
+def _format_custom_payload_block(request_id, request_block, candidate_values_pool):
     primitive = request_block[0]
-    if primitive == primitives.FUZZABLE_GROUP:
-        field_name = request_block[1]
-        default_val = request_block[2]
-        quoted = request_block[3]
-        examples = request_block[4]
-    elif primitive in [ primitives.CUSTOM_PAYLOAD,
-                        primitives.CUSTOM_PAYLOAD_HEADER,
-                        primitives.CUSTOM_PAYLOAD_QUERY,
-                        primitives.CUSTOM_PAYLOAD_UUID4_SUFFIX ]:
-        default_val = None
-        field_name = request_block[1]
-        quoted = request_block[2]
-        examples = request_block[3]
-    else:
-        default_val = request_block[1]
-        quoted = request_block[2]
-        examples = request_block[3]
-        field_name = request_block[4]
-
-    # Handling dynamic primitives that need fresh rendering every time
-    if primitive == "restler_fuzzable_uuid4":
-        values = [primitives.restler_fuzzable_uuid4]
-    # Handle enums that have a list of values instead of one default val
-    elif primitive == "restler_fuzzable_group":
-        values = list(default_val)
-    # Handle multipart/formdata
-    elif primitive == "restler_multipart_formdata":
-        values = ['_OMITTED_BINARY_DATA_']
-        default_val = '_OMITTED_BINARY_DATA_'
-    # Handle custom payload
-    elif primitive == "restler_custom_payload" or\
-         primitive == "restler_custom_payload_header" or\
-         primitive == "restler_custom_payload_query":
-        current_fuzzable_tag = field_name
-        values = candidate_values_pool.get_candidate_values(primitive, request_id=request_id, tag=current_fuzzable_tag, quoted=quoted)
-        if not isinstance(values, list):
-            values = [values]
-        if len(values) == 1:
-            default_val = values[0]
-    # Handle custom payload with uuid4 suffix
-    elif primitive == "restler_custom_payload_uuid4_suffix":
-        current_fuzzable_tag = field_name
-        values = candidate_values_pool.get_candidate_values(primitive, request_id=request_id, tag=current_fuzzable_tag, quoted=quoted)
+    default_val = None
+    values = candidate_values_pool.get_candidate_values(primitive, request_id=request_id,
+                                                        tag=request_block[1], quoted=request_block[2])
+    if not isinstance(values, list):
+        # A single value is wrapped in a tuple, which is cheaper to create than a list
+        values = (values,)
+    if len(values) == 1:
         default_val = values[0]
-    # Handle all the rest
-    else:
-        values = candidate_values_pool.get_fuzzable_values(primitive, default_val, request_id, quoted=quoted, examples=examples)
-        if primitives.is_value_generator(values):
-            values = [values]
     return primitive, values, default_val
 
+def _format_custom_payload_uuid4_suffix_block(request_id, request_block, candidate_values_pool):
+    primitive = request_block[0]
+    values = candidate_values_pool.get_candidate_values(primitive, request_id=request_id,
+                                                        tag=request_block[1], quoted=request_block[2])
+    return primitive, values, values[0]
+
+def _format_fuzzable_block(request_id, request_block, candidate_values_pool):
+    primitive = request_block[0]
+    default_val = request_block[1]
+    values = candidate_values_pool.get_fuzzable_values(primitive, default_val, request_id,
+                                                       quoted=request_block[2], examples=request_block[3])
+    if primitives.is_value_generator(values):
+        values = (values,)
+    return primitive, values, default_val
+
+# Formatters of the request blocks whose values are not taken from the fuzzable values
+# of the candidate values pool, by primitive type
+Request_Block_Formatters = {
+    primitives.FUZZABLE_UUID4: _format_fuzzable_uuid4_block,
+    primitives.FUZZABLE_GROUP: _format_fuzzable_group_block,
+    primitives.FUZZABLE_MULTIPART_FORMDATA: _format_multipart_formdata_block,
+    primitives.CUSTOM_PAYLOAD: _format_custom_payload_block,
+    primitives.CUSTOM_PAYLOAD_HEADER: _format_custom_payload_block,
+    primitives.CUSTOM_PAYLOAD_QUERY: _format_custom_payload_block,
+    primitives.CUSTOM_PAYLOAD_UUID4_SUFFIX: _format_custom_payload_uuid4_suffix_block,
+}
+
+def format_request_block(request_id, request_block, candidate_values_pool):
+    """ Gets the values of a request block to be printed in the rendering stats
+
+    @return: The primitive type, the list of its values and its default value
+    @rtype : Tuple(Str, List, Any)
+
+    """
+    formatter = Request_Block_Formatters.get(request_block[0], _format_fuzzable_block)
+    return formatter(request_id, request_block, candidate_values_pool)
+
 
 def get_rendering_stats_definition(request, candidate_values_pool, log_file=None, log_all_fuzzable_values=False):
     print_values=[]
@@ -1103,7 +1573,7 @@ def get_rendering_stats_definition(request, candidate_values_pool, log_file=None
     for request_block in request.definition:
         primitive, values, default_val = format_request_block(request.request_id, request_block, candidate_values_pool)
 
-        if isinstance(values, list) and len(values) > 1:
+        if isinstance(values, (list, tuple)) and len(values) > 1:
             print_val=values if log_all_fuzzable_values else f"[{values[0]}, {values[1]}, ...]"
             print_values.append(f"\t\t+ {primitive}: {print_val}")
         elif isinstance(default_val, list) and len(default_val) > 1:
@@ -1146,36 +1616,27 @@ def print_request_rendering_stats(candidate_values_pool, fuzzing_requests, fuzzi
     @rtype : None
 
     """
-    from engine.transport_layer.response import VALID_CODES
-    from engine.transport_layer.response import RESTLER_INVALID_CODE
     successful_requests = []
     fully_valid_count = 0
-    for r in fuzzing_requests.all_requests:
-        query_result = fuzzing_monitor.query_status_codes_monitor(r, VALID_CODES, [RESTLER_INVALID_CODE], global_lock)
+    query_results = fuzzing_monitor.query_status_codes_monitor_batch(fuzzing_requests.all_requests, VALID_CODES, [RESTLER_INVALID_CODE], global_lock)
+    for query_result in query_results:
         successful_requests.append(query_result.valid_code)
         if(query_result.fully_valid):
             fully_valid_count += 1
 
     timestamp = formatting.timestamp()
 
-    if generation == PREPROCESSING_GENERATION:
-        generation_name = "Preprocessing"
-    elif generation == POSTPROCESSING_GENERATION:
-        generation_name = "Postprocessing"
-    else:
-        generation_name = f"Generation-{generation}"
-
-    with open(REQUEST_RENDERING_LOGS, "a+", encoding='utf-8') as log_file:
-        print(f"\n{timestamp}: {generation_name}"\
-              f"\n{timestamp}: \tRendered requests: {num_rendered_requests} / {fuzzing_requests.size_all_requests}"\
-              f"\n{timestamp}: \tRendered requests with \"valid\" status codes: {sum(successful_requests)} / {num_rendered_requests}"\
-              f"\n{timestamp}: \tRendered requests determined to be fully valid (no resource creation failures): {fully_valid_count} / {num_rendered_requests}", file=log_file)
+    generation_name = GENERATION_NAMES.get(generation) or f"Generation-{generation}"
 
-        # if all request have succeded, we don't need longer generations
-        if sum(successful_requests) == len(successful_requests):
-            return
+    # The stats are assembled in memory and appended to the log with a single write
+    lines = [f"\n{timestamp}: {generation_name}"\
+             f"\n{timestamp}: \tRendered requests: {num_rendered_requests} / {fuzzing_requests.size_all_requests}"\
+             f"\n{timestamp}: \tRendered requests with \"valid\" status codes: {sum(successful_requests)} / {num_rendered_requests}"\
+             f"\n{timestamp}: \tRendered requests determined to be fully valid (no resource creation failures): {fully_valid_count} / {num_rendered_requests}\n"]
 
-        print(f"{timestamp}: List of failing requests:", file=log_file)
+    # if all request have succeded, we don't need longer generations
+    if sum(successful_requests) != len(successful_requests):
+        lines.append(f"{timestamp}: List of failing requests:\n")
 
         for ind, request in enumerate(fuzzing_requests):
             if successful_requests[ind]:
@@ -1185,13 +1646,15 @@ def print_request_rendering_stats(candidate_values_pool, fuzzing_requests, fuzzi
                 continue
 
             if len(request.definition) == 0:
-                return
+                break
 
-            print(f"\tRequest: {ind}", file=log_file)
-            format_rendering_stats_definition(request, candidate_values_pool, log_file)
+            lines.append(f"\tRequest: {ind}\n")
+            lines.append(f"{get_rendering_stats_definition(request, candidate_values_pool)}\n\n")
+        else:
+            lines.append("-------------------------\n\n")
 
-        print("-------------------------\n", file=log_file)
-        log_file.flush()
+    with open(REQUEST_RENDERING_LOGS, "a", encoding='utf-8') as log_file:
+        log_file.write("".join(lines))
 
 
 def print_request_rendering_stats_never_rendered_requests(fuzzing_requests,
@@ -1210,28 +1673,29 @@ def print_request_rendering_stats_never_rendered_requests(fuzzing_requests,
     @rtype : None
 
     """
-    with open(REQUEST_RENDERING_LOGS, "a+", encoding='utf-8') as log_file:
-        print(f"\n{formatting.timestamp()}: \tNever Rendered requests:", file=log_file)
+    # The stats are assembled in memory and appended to the log with a single write
+    lines = [f"\n{formatting.timestamp()}: \tNever Rendered requests:\n"]
 
-        for ind, request in enumerate(fuzzing_requests):
-            if fuzzing_monitor.is_fully_rendered_request(request):
-                continue
+    for ind, request in enumerate(fuzzing_requests):
+        if fuzzing_monitor.is_fully_rendered_request(request):
+            continue
 
-            if len(request.definition) == 0:
-                return
+        if len(request.definition) == 0:
+            break
 
-            print(f"\tRequest: {ind}", file=log_file)
-            format_rendering_stats_definition(request, candidate_values_pool, log_file)
+        lines.append(f"\tRequest: {ind}\n")
+        lines.append(f"{get_rendering_stats_definition(request, candidate_values_pool)}\n\n")
+    else:
+        lines.append("-------------------------\n\n")
 
-        print("-------------------------\n", file=log_file)
-        log_file.flush()
+    with open(REQUEST_RENDERING_LOGS, "a", encoding='utf-8') as log_file:
+        log_file.write("".join(lines))
 
 
 def print_request_coverage(request=None, rendered_sequence=None, log_rendered_hash=True):
     """ Prints the coverage information for a request to the spec
-    coverage file.  Pre-requisite: the file contains a json dictionary with
-    zero or more elements.  The json object will be written into the
-    top-level object.
+    coverage file.  The json object is appended to the incremental
+    spec coverage file on its own line.
 
     @param rendered_sequence: The rendered sequence
     @type  rendered_sequence: RenderedSequence
@@ -1243,10 +1707,32 @@ def print_request_coverage(request=None, rendered_sequence=None, log_rendered_ha
     SpecCoverageLog.Instance().log_request_coverage_incremental(request, rendered_sequence, log_rendered_hash)
 
 
-def generate_summary_speccov():
-    """ Takes the existing spec coverage file and generates a new file that aggregates the data by request type
+def write_speccov_files():
+    """ Generates the json spec coverage files from the coverage logged during the run.
+    In smoke test mode, also generates the summary spec coverage file that aggregates
+    the data by request type.
 
     @return: None
     @rtype : None
     """
-    SpecCoverageLog.Instance().generate_summary_speccov()
+    SpecCoverageLog.Instance().write_speccov_files()
+
+def _write_speccov_files_at_exit():
+    """ Generates the json spec coverage files at exit if coverage was logged since they
+    were last generated, so that they are also available when the run is stopped early
+    (e.g. by Ctrl+C).
+
+    @return: None
+    @rtype : None
+    """
+    try:
+        spec_coverage_log = SpecCoverageLog.Instance()
+    except Exception:
+        # Nothing was fuzzed
+        return
+    try:
+        spec_coverage_log.write_speccov_files_if_changed()
+    except Exception as error:
+        print(f"Exception writing the spec coverage files: {error!s}")
+
+atexit.register(_write_speccov_files_at_exit)
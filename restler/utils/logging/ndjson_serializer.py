@@ -9,7 +9,8 @@ import os
 import glob
 import time
 import json
-import logging
+import atexit
+import threading
 
 from restler_settings import Settings
 from utils.logging.serializer_base import *
@@ -24,15 +25,34 @@ class CustomRotatingFileHandler(RotatingFileHandler):
         base_name, type_ext = os.path.splitext(base_name)
         return base_name + count_ext + type_ext
 
+    def _open(self):
+        """Opens the log file in binary mode, since the trace log writer writes the
+        utf-8 encoded records directly to the stream.
+        """
+        return open(self.baseFilename, 'ab')
+
+# The version of the trace log record format.
+#   1: 'request_json' and 'response_json' are the json bodies serialized to strings
+#      (the records of version 1 do not have a 'format_version' field)
+#   2: 'request_json' and 'response_json' are the json bodies, embedded in the record
+TRACE_LOG_FORMAT_VERSION = 2
+
 class RequestTraceLog():
-    def __init__(self, request_id=None, sequence_id=None, combination_id=None, tags={}, sequence_tags={},
+    # A trace log is created for every request and response, so the attributes are
+    # stored in slots rather than in a per-instance dictionary.
+    __slots__ = ('request_id', 'sequence_id', 'tags', 'replay_blocks', 'origin', 'sequence_tags',
+                 'combination_id', 'sent_timestamp', 'received_timestamp', '_request', '_response',
+                 'request_json', 'response_json', 'hex_definition')
+
+    def __init__(self, request_id=None, sequence_id=None, combination_id=None, tags=None, sequence_tags=None,
                  replay_blocks=None):
         self.request_id = request_id
         self.sequence_id = sequence_id
-        self.tags = tags
+        # The tag dictionaries may be shared with other trace logs, so they are not modified in place
+        self.tags = {} if tags is None else tags
         self.replay_blocks = replay_blocks
         self.origin = None
-        self.sequence_tags = sequence_tags
+        self.sequence_tags = {} if sequence_tags is None else sequence_tags
         self.combination_id = combination_id
         self.sent_timestamp = None
         self.received_timestamp = None
@@ -52,8 +72,12 @@ class RequestTraceLog():
         instance.response = log_dict.get('response')
         request_json = log_dict.get('request_json')
         response_json = log_dict.get('response_json')
-        instance.request_json = None if request_json is None else json.loads(request_json)
-        instance.response_json = None if response_json is None else json.loads(response_json)
+        if log_dict.get('format_version', 1) < 2:
+            # The json bodies are serialized to strings
+            request_json = None if request_json is None else json.loads(request_json)
+            response_json = None if response_json is None else json.loads(response_json)
+        instance.request_json = request_json
+        instance.response_json = response_json
         instance.origin = None if 'origin' not in instance.tags else instance.tags['origin']
 
         instance.sequence_id = None if 'sequence_id' not in instance.tags else instance.tags['sequence_id']
@@ -121,20 +145,36 @@ class RequestTraceLog():
         tags.update(self.sequence_tags)
         request_text = None if omit_request_text == True else self.request
         request_text = logger.remove_tokens_from_logs(request_text) if remove_tokens_from_logs else request_text
-        
+
         return {
             'sent_timestamp': self.sent_timestamp,
             'received_timestamp': self.received_timestamp,
             'request': request_text,
             'response': self.response,
-            'request_json': None if self.request_json is None else json.dumps(self.request_json),
-            'response_json': None if self.response_json is None else json.dumps(self.response_json),
+            # The json bodies are serialized along with the rest of the record
+            'request_json': self.request_json,
+            'response_json': self.response_json,
             'tags': tags,
             # replay blocks contain a list of tuples.  Each tuple contains strings or None,
-            # so it should be safe to serialize directly to JSON
-            'replay_blocks': None if self.replay_blocks is None else self.replay_blocks
+            # so it should be safe to serialize directly to JSON.  The list is copied, since
+            # the record may be serialized after the sequence trace log has moved on.
+            'replay_blocks': None if self.replay_blocks is None else list(self.replay_blocks),
+            'format_version': TRACE_LOG_FORMAT_VERSION
         }
 
+def _load_trace_log_dicts(filename):
+    """Returns the list of log dictionaries from one trace log file."""
+    # Read the file in bulk and parse the raw lines, which avoids decoding them separately
+    with open(filename, 'rb') as f:
+        lines = f.read().splitlines()
+    log_dicts = []
+    for line in lines:
+        try:
+            log_dicts.append(logger.json_loads(line))
+        except json.JSONDecodeError:
+            print(f"Warning: Skipping malformed data in {filename}")
+    return log_dicts
+
 class JsonTraceLogReader(TraceLogReaderBase):
     def __init__(self, root_directory=None, log_file_paths=[]):
         if root_directory is None and not log_file_paths:
@@ -166,19 +206,14 @@ class JsonTraceLogReader(TraceLogReaderBase):
 
         data = []
         for filename in existing_files:
-            with open(filename, 'r') as f:
-                for line in f:
-                    try:
-                        log_dict = json.loads(line)
-                        trace_log = RequestTraceLog.from_dict(log_dict)
-                        data.append(trace_log)
-                    except json.JSONDecodeError:
-                        print(f"Warning: Skipping malformed data in {filename}")
+            data.extend(RequestTraceLog.from_dict(log_dict) for log_dict in _load_trace_log_dicts(filename))
         return data
 
 class JsonTraceLogWriter(TraceLogWriterBase):
 
     _MaxDbSize = 1024*1024*100 # = 100MB
+    # Size, in bytes, of the buffered records after which they are written to the trace log
+    _FlushThreshold = 64*1024
     def __init__(self, root_directory=None, storage_limit=_MaxDbSize):
         if root_directory is None:
             raise Exception("ERROR: 'root_directory' must be specified")
@@ -191,9 +226,6 @@ class JsonTraceLogWriter(TraceLogWriterBase):
         # Remember whether the trace DB already exists, since the file handler will create the file
         trace_db_exists = os.path.exists(log_file_path)
 
-        self.logger = logging.getLogger('restler_trace_logger')
-        self.logger.setLevel(logging.INFO)
-
         self.handler = CustomRotatingFileHandler(log_file_path, maxBytes=storage_limit, backupCount=10000)
 
         # If the trace DB already exists, but the user has not specified a trace DB file path, then
@@ -201,9 +233,49 @@ class JsonTraceLogWriter(TraceLogWriterBase):
         if trace_db_exists and Settings().trace_db_file_path is None:
             self.handler.doRollover()
 
-        self.logger.addHandler(self.handler)
+        # Track the size of the current log, to avoid querying the stream before every write
+        self._log_size = os.path.getsize(log_file_path)
+
+        # Records are buffered and written directly to the handler's stream in batches.
+        # The handler is not attached to a logger, so no log records are created.
+        self._buffer = []
+        self._buffer_size = 0
+        self._buffer_lock = threading.Lock()
+        atexit.register(self.flush)
 
     def save(self, data):
-        self.logger.info(json.dumps(data))
+        self.save_batch([data])
+
+    def save_batch(self, data_list):
+        records = b"".join([logger.json_dumps_bytes(data, indent=False) + b"\n" for data in data_list])
+        with self._buffer_lock:
+            self._buffer.append(records)
+            self._buffer_size += len(records)
+            if self._buffer_size < JsonTraceLogWriter._FlushThreshold:
+                return
+        self.flush()
+
+    def flush(self):
+        with self._buffer_lock:
+            if not self._buffer:
+                return
+            records = b"".join(self._buffer)
+            self._buffer = []
+            self._buffer_size = 0
+
+            self.handler.acquire()
+            try:
+                if self.handler.stream is None:
+                    self.handler.stream = self.handler._open()
+                # Roll over the same way the handler does when emitting a record
+                if self.handler.maxBytes > 0 and\
+                   self._log_size + len(records) >= self.handler.maxBytes:
+                    self.handler.doRollover()
+                    self._log_size = 0
+                self.handler.stream.write(records)
+                self.handler.stream.flush()
+                self._log_size += len(records)
+            finally:
+                self.handler.release()
 
 
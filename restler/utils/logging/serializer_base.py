@@ -19,6 +19,29 @@ class TraceLogWriterBase(ABC):
         """
         pass
 
+    def save_batch(self, data_list):
+        """ Save a batch of data to the trace log
+
+        @param data_list: The data to be saved to the trace log, in order
+        @type  data_list: List[String]
+
+        @return: None
+        @rtype : None
+
+        """
+        for data in data_list:
+            self.save(data)
+
+    def flush(self):
+        """ Writes out any data buffered by save().  Called when there are no
+        more trace log messages waiting to be saved.
+
+        @return: None
+        @rtype : None
+
+        """
+        pass
+
 class TraceLogReaderBase(ABC):
     @abstractmethod
     def load(self):
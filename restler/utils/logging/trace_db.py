@@ -9,27 +9,27 @@ import time
 import queue
 import threading
 import uuid
+import contextvars
 import utils.import_utilities as import_utilities
 
 DEFAULT_ORIGIN = 'main_driver'
 
-# Thread local storage for tracking the current sequence and request
-threadLocal = threading.local()
+# Tracks the current sequence and request.  Each thread has its own context, so this
+# is thread-local, and looking it up is cheaper than a threading.local attribute.
+_trace_var = contextvars.ContextVar('trace', default=None)
 
 def _get_trace():
-    """Gets the thread-local trace property for the current thread."""
-    if not hasattr(threadLocal, 'trace'):
-        threadLocal.trace = {}
-        threadLocal.thread_id = threading.get_ident() # for debugging
-    return threadLocal.trace
+    """Gets the trace property for the current thread."""
+    trace = _trace_var.get()
+    if trace is None:
+        trace = {}
+        _trace_var.set(trace)
+    return trace
 
 class SequenceTracker:
     @staticmethod
     def get_trace_log():
-        trace = _get_trace()
-        if 'sequence' not in trace:
-            return None
-        return trace['sequence']
+        return _get_trace().get('sequence')
 
     @staticmethod
     def get_sequence_id():
@@ -40,7 +40,7 @@ class SequenceTracker:
 
 
     @staticmethod
-    def initialize_sequence_trace(combination_id, tags={}):
+    def initialize_sequence_trace(combination_id, tags=None):
         """Requests and responses are logged separately, but metadata about sequences is tracked and logged
         with each request and response. This function initializes the metadata for the current sequence.
         """
@@ -56,7 +56,7 @@ class SequenceTracker:
                                             sequence_tags=tags)
 
     @staticmethod
-    def initialize_request_trace(request_id=None, combination_id=None, tags={}, replay_blocks=None):
+    def initialize_request_trace(request_id=None, combination_id=None, tags=None, replay_blocks=None):
         """Initialize trace log for the request."""
         trace = _get_trace()
 
@@ -103,10 +103,7 @@ class SequenceTracker:
 
     @staticmethod
     def get_origin():
-        trace = _get_trace()
-        if 'origin' not in trace:
-            return None
-        return trace['origin']
+        return _get_trace().get('origin')
 
 def get_sequences_from_db(db_file_path, include_origins=None):
     """Gets the sequences from the trace database.
@@ -157,20 +154,26 @@ class TraceDatabase:
         only one logger at a time is supported).
         The default format is newline-delimited json.
     """
+    # Maximum number of messages passed to the serializer at once
+    _MaxBatchSize = 256
+
     def __init__(self, storage_writer):
         self.storage_writer = storage_writer
         self._log_queue = queue.SimpleQueue()
+        # Set by the trace database thread when it has saved everything on the queue
+        self._log_queue_drained = threading.Event()
         self._finished = False
 
     @property
     def trace(self):
         return _get_trace()
 
-    def log_request_response(self, request=None, response=None,  tags={}, timestamp=None):
+    def log_request_response(self, request=None, response=None,  tags=None, timestamp=None):
         if request is None and response is None:
             raise Exception("ERROR: Request or response must be specified.")
         try:
-            tls_trace_log = SequenceTracker.get_trace_log()
+            trace = _get_trace()
+            tls_trace_log = trace.get('sequence')
             if tls_trace_log is None:
                 # Logging requests outside of sequence context (e.g. GC or checker requests
                 # that are not part of a sequence)
@@ -184,7 +187,7 @@ class TraceDatabase:
                                             # Only log the replay blocks for sent requests
                                             replay_blocks=None if request is None else tls_trace_log.replay_blocks)
 
-            trace_log.origin = SequenceTracker.get_origin()
+            trace_log.origin = trace.get('origin')
             if request:
                 trace_log.request = request
                 if timestamp is not None:
@@ -194,11 +197,15 @@ class TraceDatabase:
                 if timestamp is not None:
                     trace_log.received_timestamp = timestamp
             if tags:
-                trace_log.tags.update(tags)
+                # The tags are shared with the sequence trace log, so they are copied before being extended
+                trace_log.tags = {**trace_log.tags, **tags}
 
             if 'origin' not in trace_log.tags and 'origin' not in trace_log.sequence_tags and trace_log.origin is None:
                 raise Exception(f"Missing origin: request: {trace_log.request_id}, sequence: {trace_log.sequence_id}")
-            record = trace_log.to_dict(omit_request_text=Settings().trace_db_omit_request_text, remove_tokens_from_logs=Settings().no_tokens_in_logs)
+            # The record is built on the calling thread, since the sequence trace log it
+            # was created from keeps changing while the record waits on the queue
+            record = trace_log.to_dict(omit_request_text=Settings().trace_db_omit_request_text,
+                                       remove_tokens_from_logs=Settings().no_tokens_in_logs)
             self.log(record)
         except Exception as error:
             # print the callstack
@@ -208,28 +215,64 @@ class TraceDatabase:
             pass
 
     def log(self, message):
-        if self._finished:
-            raise Exception("ERROR: log() should not be called after finish().")
+        # log() is called for every request and response, so it does not check whether
+        # finish() was called.  Messages logged after finish() are not saved.
         self._log_queue.put(message)
 
     def log_queue_empty(self):
         return self._log_queue.empty()
 
+    def wait_for_empty_log_queue(self, timeout):
+        """Blocks until the trace database thread has saved all of the messages on the queue.
+
+        @param timeout: The maximum time to wait, in seconds
+        @type  timeout: Float
+
+        @return: True if the queue was drained before the timeout expired
+        @rtype : Bool
+        """
+        deadline = time.time() + timeout
+        while True:
+            # Clear the event before checking the queue, so that a drain which
+            # happens after the check is not missed.
+            self._log_queue_drained.clear()
+            if self._log_queue.empty():
+                return True
+            remaining_time = deadline - time.time()
+            if remaining_time <= 0 or not self._log_queue_drained.wait(remaining_time):
+                return self._log_queue.empty()
+
     def finish(self):
         if self._finished:
             raise Exception("ERROR: finish() should only be called once.")
         self._finished = True
         self._log_queue.put(None)
 
-    def save_log_message(self):
-        """Takes a message off the queue and saves it using the specified serializer.
-            If fewer messages are available, it will save all available messages.
+    def save_log_messages(self):
+        """Takes the messages off the queue and saves them using the specified serializer.
+            Blocks until a message is available, then saves it along with the other messages
+            already waiting on the queue, up to the maximum batch size.
         """
+        messages = []
         message = self._log_queue.get()
-        if message is None:
-            # End of tracing signal
-            return
-        self.storage_writer.save(message)
+        while message is not None:
+            messages.append(message)
+            if len(messages) >= TraceDatabase._MaxBatchSize:
+                break
+            try:
+                message = self._log_queue.get_nowait()
+            except queue.Empty:
+                break
+        end_of_tracing = message is None
+
+        if messages:
+            self.storage_writer.save_batch(messages)
+        # Buffered messages are written out once the queue is drained, so that
+        # a burst of messages is written to storage together.  A None message
+        # is the end of tracing signal.
+        if end_of_tracing or self._log_queue.empty():
+            self.storage_writer.flush()
+            self._log_queue_drained.set()
 
     def load_trace_data(self):
         self.storage_writer.load()
@@ -296,7 +339,7 @@ class TraceDatabaseThread(threading.Thread):
 
         """
         while not self.stop_event.is_set():
-            self._trace_db.save_log_message()
+            self._trace_db.save_log_messages()
 
     def finish(self, max_cleanup_time):
         """ Begins the final cleanup
@@ -308,11 +351,7 @@ class TraceDatabaseThread(threading.Thread):
         @rtype : None
 
         """
-        cleanup_start_time = time.time()
-        elapsed_time = 0
-        while not self._trace_db.log_queue_empty() and elapsed_time < max_cleanup_time:
-            time.sleep(1)
-            elapsed_time = time.time() - cleanup_start_time
+        self._trace_db.wait_for_empty_log_queue(max_cleanup_time)
 
         self.stop_event.set()
         # If the worker is waiting for new items on the queue, this will unblock it.
@@ -17,10 +17,7 @@ def parse_serviceuserpost(data, **kwargs):
         headers = kwargs['headers']
 
 
-    # Parse body if needed
-    if data:
 
-        pass
 
     # Try to extract each dynamic object
 
@@ -29,22 +26,18 @@ def parse_serviceuserpost(data, **kwargs):
     if headers:
         # Try to extract dynamic objects from headers
 
-        try:
-            temp_7262 = str(headers["userId"])
+        temp_7262 = headers.get("userId")
+        if temp_7262 is not None:
+            temp_7262 = str(temp_7262)
 
-        except Exception as error:
-            # This is not an error, since some properties are not always returned
-            pass
 
-        pass
 
     # If no dynamic objects were extracted, throw.
     if not (temp_7262):
         raise ResponseParsingException("Error: all of the expected dynamic objects were not present in the response.")
 
     # Set dynamic variables
-    if temp_7262:
-        dependencies.set_variable("_service_user_post_userId_header", temp_7262)
+    dependencies.set_variable("_service_user_post_userId_header", temp_7262)
 
 req_collection = requests.RequestCollection([])
 # Endpoint: /service/user, method: Post
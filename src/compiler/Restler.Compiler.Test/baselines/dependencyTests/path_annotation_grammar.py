@@ -27,10 +27,9 @@ def parse_storespost(data, **kwargs):
     if data:
 
         try:
-            data = json.loads(data)
+            data = dependencies.json_loads(data)
         except Exception as error:
             raise ResponseParsingException("Exception parsing response, data was not valid json: {}".format(error))
-        pass
 
     # Try to extract each dynamic object
 
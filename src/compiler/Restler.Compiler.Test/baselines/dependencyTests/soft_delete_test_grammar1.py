@@ -23,10 +23,9 @@ def parse_appappIdput(data, **kwargs):
     if data:
 
         try:
-            data = json.loads(data)
+            data = dependencies.json_loads(data)
         except Exception as error:
             raise ResponseParsingException("Exception parsing response, data was not valid json: {}".format(error))
-        pass
 
     # Try to extract each dynamic object
 
@@ -44,8 +43,7 @@ def parse_appappIdput(data, **kwargs):
         raise ResponseParsingException("Error: all of the expected dynamic objects were not present in the response.")
 
     # Set dynamic variables
-    if temp_7262:
-        dependencies.set_variable("_app__appId__put_id", temp_7262)
+    dependencies.set_variable("_app__appId__put_id", temp_7262)
 
 req_collection = requests.RequestCollection([])
 # Endpoint: /app/{appId}, method: Put
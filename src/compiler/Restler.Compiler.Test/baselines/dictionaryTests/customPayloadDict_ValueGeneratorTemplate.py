@@ -8,6 +8,8 @@ print(f"Value generator random seed: {random_seed}")
 random.seed(random_seed)
 
 EXAMPLE_ARG = "examples"
+# The characters used to generate alphanumeric strings
+ALPHANUMERIC_CHARS = string.ascii_letters + string.digits
 
 
 def gen_restler_fuzzable_string(**kwargs):
@@ -30,13 +32,13 @@ def gen_restler_fuzzable_string(**kwargs):
             new_values=''.join(random.choices(ex, k=ex_k))
             yield ex[:ex_k] + new_values + ex[ex_k:]
 
-        yield ''.join(random.choices(string.ascii_letters + string.digits, k=size))
+        yield ''.join(random.choices(ALPHANUMERIC_CHARS, k=size))
         yield ''.join(random.choices(string.printable, k=size)).replace("\r\n", "")
 
 def placeholder_value_generator():
     while True:
         yield str(random.randint(-10, 10))
-        yield ''.join(random.choices(string.ascii_letters + string.digits, k=1))
+        yield ''.join(random.choices(ALPHANUMERIC_CHARS, k=1))
     
 
 def gen_restler_fuzzable_string_unquoted(**kwargs):
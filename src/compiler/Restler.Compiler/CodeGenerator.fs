@@ -920,17 +920,18 @@ let getResponseParsers (requests: Request list) =
                             sprintf "[\"%s\"]" part
 
                     let parsingStatement =
-                        let dataSource, accessPath =
-                            match variableKind with
-                            | ResponseVariableKind.Body -> "data", w.accessPathParts.path
-                            | ResponseVariableKind.Header -> "headers", w.accessPathParts.path |> Array.truncate 1
-
-                        let extractData =
-                            accessPath
-                            |> Array.map getPath
-                            |> String.concat ""
-
-                        sprintf "%s = str(%s%s)" tempVariableName dataSource extractData
+                        match variableKind with
+                        | ResponseVariableKind.Body ->
+                            let extractData =
+                                w.accessPathParts.path
+                                |> Array.map getPath
+                                |> String.concat ""
+                            sprintf "%s = str(data%s)" tempVariableName extractData
+                        | ResponseVariableKind.Header ->
+                            // The headers are a dictionary, so look up the header instead of
+                            // catching an exception when it is not returned.
+                            let headerName = w.accessPathParts.path |> Array.head
+                            sprintf "%s = headers.get(\"%s\")" tempVariableName headerName
                     let initCheck = sprintf "if %s:" tempVariableName
                     let initStatement = sprintf "dependencies.set_variable(\"%s\", %s)"
                                             dynamicObjectVariableName
@@ -958,25 +959,38 @@ let getResponseParsers (requests: Request list) =
                 (if booleanConversionStatement.IsSome then booleanConversionStatement.Value else "")
 
 
+        let parsingStatementWithNoneCheck parsingStatement tempVariableName (booleanConversionStatement:string option) =
+            sprintf "
+        %s
+        if %s is not None:
+            %s = str(%s)
+            %s
+"                parsingStatement
+                tempVariableName
+                tempVariableName tempVariableName
+                (if booleanConversionStatement.IsSome then booleanConversionStatement.Value else "")
+
+        // The body is only parsed if there are dynamic objects to extract from it
         let getParseBodyStatement() =
             """
+    # Parse body if needed
+    if data:
         try:
-            data = json.loads(data)
+            data = dependencies.json_loads(data)
         except Exception as error:
             raise ResponseParsingException("Exception parsing response, data was not valid json: {}".format(error))"""
 
         let getHeaderParsingStatements responseHeaderParsingStatements =
             let parsingStatements =
                 responseHeaderParsingStatements
-                 |> List.map(fun (_,parsingStatement,_,_,_,booleanConversionStatement) ->
-                                parsingStatementWithTryExcept parsingStatement booleanConversionStatement)
+                 |> List.map(fun (_,parsingStatement,_,_,tempVariableName,booleanConversionStatement) ->
+                                parsingStatementWithNoneCheck parsingStatement tempVariableName booleanConversionStatement)
                  |> String.concat "\n"
 
             sprintf """
     if headers:
         # Try to extract dynamic objects from headers
 %s
-        pass
         """
                 parsingStatements
 
@@ -989,11 +1003,7 @@ def %s(data, **kwargs):
     if 'headers' in kwargs:
         headers = kwargs['headers']
 
-
-    # Parse body if needed
-    if data:
 %s
-        pass
 
     # Try to extract each dynamic object
 %s
@@ -1028,9 +1038,14 @@ def %s(data, **kwargs):
                                                         tempVariableName)
                                         |> String.concat " or ")
 
-                                        (responseBodyParsingStatements @ responseHeaderParsingStatements
-                                         |> List.map(fun (_,_,initCheck,initStatement,_,_) ->
-                                                        (TAB + initCheck + "\n" + TAB + TAB + initStatement)) |> String.concat "\n")
+                                        // When there is only one dynamic object, the check above already
+                                        // confirmed that it was extracted.
+                                        (match responseBodyParsingStatements @ responseHeaderParsingStatements with
+                                         | [ (_,_,_,initStatement,_,_) ] -> TAB + initStatement
+                                         | parsingStatements ->
+                                            parsingStatements
+                                            |> List.map(fun (_,_,initCheck,initStatement,_,_) ->
+                                                           (TAB + initCheck + "\n" + TAB + TAB + initStatement)) |> String.concat "\n")
 
         PythonGrammarElement.ResponseParserDefinition functionDefinition
 
@@ -1313,6 +1328,8 @@ let generateCustomValueGenTemplate dictionaryText =
     let imports = ["typing"; "random"; "time"; "string"; "itertools"]
     let constants = """
 EXAMPLE_ARG = "examples"
+# The characters used to generate alphanumeric strings
+ALPHANUMERIC_CHARS = string.ascii_letters + string.digits
 """
 
     let dictionaryJson = JObject.Parse(dictionaryText)
@@ -1367,13 +1384,13 @@ def gen_restler_fuzzable_string(**kwargs):
             new_values=''.join(random.choices(ex, k=ex_k))
             yield ex[:ex_k] + new_values + ex[ex_k:]
 
-        yield ''.join(random.choices(string.ascii_letters + string.digits, k=size))
+        yield ''.join(random.choices(ALPHANUMERIC_CHARS, k=size))
         yield ''.join(random.choices(string.printable, k=size)).replace("\r\n", "")
 
 def placeholder_value_generator():
     while True:
         yield str(random.randint(-10, 10))
-        yield ''.join(random.choices(string.ascii_letters + string.digits, k=1))
+        yield ''.join(random.choices(ALPHANUMERIC_CHARS, k=1))
     """
 
     let getFunctionText functionName =
@@ -1,10 +1,59 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 
-import json
 import sys
 import argparse
-from collections import OrderedDict
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from speccov_json import load_json, dump_json
+
+def try_load_json(path):
+    """ Loads a JSON file, returning the error instead of raising it.
+
+    @param path: The path to the JSON file
+    @type  path: Str
+
+    @return: The deserialized JSON object (or None) and the error (or None)
+    @rtype : Tuple(Object, Exception)
+
+    """
+    try:
+        return load_json(path), None
+    except Exception as err:
+        return None, err
+
+def iter_loaded_files(paths, max_workers):
+    """ Loads JSON files in parallel, yielding each file in the order of @param paths.
+    At most @param max_workers files are loaded ahead of the file that is yielded,
+    so each file can be freed once the caller is done with it.
+
+    @param paths: The paths to the JSON files
+    @type  paths: List[Str]
+    @param max_workers: The maximum number of files loaded at the same time
+    @type  max_workers: Int
+
+    @return: The path, the deserialized JSON object (or None) and the error (or None) of each file
+    @rtype : Generator(Tuple(Str, Object, Exception))
+
+    """
+    paths = iter(paths)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for path in paths:
+            pending.append((path, executor.submit(try_load_json, path)))
+            if len(pending) >= max_workers:
+                break
+        while pending:
+            path, future = pending.popleft()
+            # Start loading the next file before this one is diffed
+            next_path = next(paths, None)
+            if next_path is not None:
+                pending.append((next_path, executor.submit(try_load_json, next_path)))
+            yield (path, *future.result())
+
+# Marks a key that is missing from a request dict (None is a valid JSON value)
+_MISSING = object()
 
 def diff_reqs(left_req, right_req):
     """ Diffs two request dicts.
@@ -20,26 +69,27 @@ def diff_reqs(left_req, right_req):
                 }
             }
     """
-    if set(left_req.keys()) != set(right_req.keys()):
+    if left_req.keys() != right_req.keys():
         print("WARNING: Request coverage keys do not match! File formats are not equal!")
 
     diffs = {}
     # Iterate through the left_req keys and compare the two requests' values.
     # NOTE: Any differences in keys here will either cause a failure or be
     # ignored. The files are expected to have matching formats.
-    for key in left_req.keys():
+    for key, left_value in left_req.items():
         # Skip the sample request, which contains concrete values in paths, timestamps, etc.
         if key == "sample_request":
             continue
-        try:
-            if (type(left_req[key]) != type(right_req[key]))\
-            or left_req[key] != right_req[key]:
-                diffs[key] = {
-                    "left": left_req[key],
-                    "right": right_req[key]
-                }
-        except KeyError:
+        right_value = right_req.get(key, _MISSING)
+        if right_value is _MISSING:
             print(f"Key, {key}, not found in right file's request!")
+            continue
+        if type(left_value) != type(right_value)\
+        or left_value != right_value:
+            diffs[key] = {
+                "left": left_value,
+                "right": right_value
+            }
 
     return diffs
 
@@ -47,7 +97,7 @@ def diff_files(left_file, right_file):
     """ Diffs two speccov json files.
     Inputs are deserialized JSON objects.
 
-    @return: An OrderedDict containing the diffs of each file.
+    @return: A dict containing the diffs of each file, in insertion order.
 
         Example format:
         {
@@ -60,19 +110,20 @@ def diff_files(left_file, right_file):
         }
 
     """
-    diffs = OrderedDict()
+    diffs = {}
     # Iterate through each request in the left file and diff its contents
     # with the matching request in the right file
-    for req_id in left_file.keys():
-        if req_id in right_file:
-            req_diff = diff_reqs(left_file[req_id], right_file[req_id])
+    for req_id, left_req in left_file.items():
+        right_req = right_file.get(req_id, _MISSING)
+        if right_req is not _MISSING:
+            req_diff = diff_reqs(left_req, right_req)
             # If there were any differences add it to the diff dict
             if req_diff:
-                diffs[left_file[req_id]['verb_endpoint']] = req_diff
+                diffs[left_req['verb_endpoint']] = req_diff
 
     # Check for any additional requests in either the left or right file
-    left_only = set(left_file.keys()).difference(set(right_file.keys()))
-    right_only = set(right_file.keys()).difference(set(left_file.keys()))
+    left_only = left_file.keys() - right_file.keys()
+    right_only = right_file.keys() - left_file.keys()
 
     if left_only:
         diffs['requests_left_only'] = [left_file[key]["verb_endpoint"] for key in left_only]
@@ -97,18 +148,16 @@ if __name__ == '__main__':
     args = parser.parse_args()
 
     try:
-        with open(args.left_file, 'r') as spec_cov:
-            left_json = json.load(spec_cov)
+        left_json = load_json(args.left_file)
     except Exception as err:
         print(f"Failed to load left file: {err!s}")
         sys.exit(-1)
 
     output = []
-    for spec in args.right_files:
-        try:
-            with open(spec, 'r') as spec_file:
-                right_json = json.load(spec_file)
-        except Exception as err:
+    # Load the right files in parallel, in the original order
+    right_files = iter_loaded_files(args.right_files, max_workers=max(1, min(8, len(args.right_files))))
+    for spec, right_json, err in right_files:
+        if err is not None:
             print(f"Failed to load right file {spec}: {err!s}.\n"
                    "Skipping diff for this file!")
             continue
@@ -119,7 +168,6 @@ if __name__ == '__main__':
             output.append(diff)
 
     output_file = args.output_file or 'spec_diffs.json'
-    with open(output_file, 'w') as f_diffs:
-        json.dump(output, f_diffs, indent=4)
+    dump_json(output, output_file)
 
 
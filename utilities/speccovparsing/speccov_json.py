@@ -0,0 +1,51 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+""" JSON file helpers shared by the spec coverage scripts. """
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def load_json(path):
+    """ Loads a JSON file, using orjson when it is installed.
+
+    @param path: The path to the JSON file
+    @type  path: Str
+
+    @return: The deserialized JSON object
+    @rtype : Object
+
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Fall back to the json module, which accepts e.g. NaN
+            pass
+    return json.loads(data)
+
+def dump_json(obj, path):
+    """ Writes an object to a JSON file, using orjson when it is installed.
+    The output is indented by two spaces with either serializer.
+
+    @param obj: The object to serialize
+    @type  obj: Object
+    @param path: The path to the output file
+    @type  path: Str
+
+    @return: None
+    @rtype : None
+
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(data)
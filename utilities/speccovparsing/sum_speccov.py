@@ -4,7 +4,32 @@
 import argparse
 import json
 import sys
-from collections import OrderedDict
+
+from speccov_json import load_json
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+def iter_requests(path):
+    """ Iterates over the request coverage entries of a spec file.
+    When ijson is installed, the entries are streamed from the file one at a
+    time instead of loading the whole file into memory.
+
+    @param path: The path to the spec file
+    @type  path: Str
+
+    @return: The coverage entry of each request
+    @rtype : Generator(Dict)
+
+    """
+    if ijson is not None:
+        with open(path, 'rb') as f:
+            for _, req in ijson.kvitems(f, ''):
+                yield req
+    else:
+        yield from load_json(path).values()
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
@@ -15,29 +40,28 @@ if __name__ == '__main__':
 
     args = parser.parse_args()
 
-    try:
-        with open(args.spec_file, 'r') as spec_cov:
-            spec_json = json.load(spec_cov)
-    except Exception as err:
-        print(f"Failed to load spec file: {err!s}")
-
+    # Total each value.  The requests are counted as they are read, so that
+    # the spec file does not need to be kept in memory.
+    total_requests = 0
     valid_requests = 0
     invalid_due_to_sequence_failure = 0
     invalid_due_to_resource_failure = 0
     invalid_due_to_parser_failure = 0
     invalid_due_to_500 = 0
-    total_requests = len(spec_json)
-
-    # Total each value
-    for req in spec_json.values():
-        valid_requests += req['valid']
-        invalid_due_to_sequence_failure += req['invalid_due_to_sequence_failure']
-        invalid_due_to_resource_failure += req['invalid_due_to_resource_failure']
-        invalid_due_to_parser_failure += req['invalid_due_to_parser_failure']
-        invalid_due_to_500 += req['invalid_due_to_500']
+    try:
+        for req in iter_requests(args.spec_file):
+            total_requests += 1
+            valid_requests += req['valid']
+            invalid_due_to_sequence_failure += req['invalid_due_to_sequence_failure']
+            invalid_due_to_resource_failure += req['invalid_due_to_resource_failure']
+            invalid_due_to_parser_failure += req['invalid_due_to_parser_failure']
+            invalid_due_to_500 += req['invalid_due_to_500']
+    except Exception as err:
+        print(f"Failed to load spec file: {err!s}")
+        sys.exit(-1)
 
     # Add to json structure
-    output = OrderedDict()
+    output = {}
     output['final_coverage'] = f'{valid_requests} / {total_requests}'
     output['num_failed_due_to_sequence_failure'] = invalid_due_to_sequence_failure
     output['num_failed_due_to_resource_failure'] = invalid_due_to_resource_failure